@@ -1,10 +1,19 @@
 """Main orchestration script for generating DocFX metadata and Wiki.js documentation."""
 
 import argparse
+import hashlib
+import json
+import os
 import subprocess
 import sys
 from collections.abc import Sequence
 from pathlib import Path
+from typing import Any
+
+from src.docfx_yml_to_wikijs import main as convert_yml_to_wikijs
+
+DOCFX_CACHE_FILE = ".docfx_cache.json"
+YAML_CACHE_DIR = ".yaml_cache"
 
 
 def run_command(cmd_list: Sequence[str | Path], cwd: Path | str | None = None) -> None:
@@ -18,6 +27,54 @@ def run_command(cmd_list: Sequence[str | Path], cwd: Path | str | None = None) -
         sys.exit(e.returncode)
 
 
+def _max_mtime_ns(root: Path) -> int:
+    """Return the newest mtime (ns) of a directory tree, including directories."""
+    if not root.exists():
+        return 0
+    latest = root.stat().st_mtime_ns
+    stack = [str(root)]
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for entry in it:
+                latest = max(latest, entry.stat(follow_symlinks=False).st_mtime_ns)
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+    return latest
+
+
+def docfx_inputs_fingerprint(root_dir: Path) -> dict[str, Any]:
+    """Fingerprint docfx.json and the metadata source trees it references."""
+    config_bytes = (root_dir / "docfx.json").read_bytes()
+    config = json.loads(config_bytes)
+    sources_mtime_ns = 0
+    for metadata in config.get("metadata") or []:
+        for src in metadata.get("src") or []:
+            src_dir = root_dir / src.get("src", ".")
+            sources_mtime_ns = max(sources_mtime_ns, _max_mtime_ns(src_dir))
+    return {
+        "docfx_json_sha256": hashlib.sha256(config_bytes).hexdigest(),
+        "sources_mtime_ns": sources_mtime_ns,
+    }
+
+
+def generate_metadata(root_dir: Path, *, force: bool = False) -> None:
+    """Run docfx metadata unless its inputs are unchanged since the last run."""
+    cache_file = root_dir / DOCFX_CACHE_FILE
+    fingerprint = docfx_inputs_fingerprint(root_dir)
+    if not force and (root_dir / "api").is_dir() and cache_file.exists():
+        try:
+            cached = json.loads(cache_file.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            cached = None
+        if cached == fingerprint:
+            print("DocFX inputs unchanged; skipping docfx metadata (cache hit).")
+            return
+
+    # This command looks for docfx.json in the current directory by default
+    run_command(["dotnet", "docfx", "metadata"])
+    cache_file.write_text(json.dumps(fingerprint, indent=2), encoding="utf-8")
+
+
 def main() -> None:
     """Run the full documentation generation pipeline."""
     parser = argparse.ArgumentParser(
@@ -38,6 +95,11 @@ def main() -> None:
         action="store_true",
         help="Ignore cache and rebuild all clusters",
     )
+    parser.add_argument(
+        "--refresh-yaml-cache",
+        action="store_true",
+        help="Re-parse all YAML files instead of using the parse cache",
+    )
     parser.add_argument(
         "--prune-stale",
         action="store_true",
@@ -52,6 +114,11 @@ def main() -> None:
         "--config",
         help="Path to configuration file",
     )
+    parser.add_argument(
+        "--force-metadata",
+        action="store_true",
+        help="Regenerate DocFX metadata even if its inputs are unchanged",
+    )
     args = parser.parse_args()
 
     root_dir = Path(__file__).parent
@@ -67,21 +134,14 @@ def main() -> None:
 
     # 1. Generate YAML metadata using dotnet docfx
     print("--- Step 1: Generating DocFX metadata ---")
-    # This command looks for docfx.json in the current directory by default
-    run_command(["dotnet", "docfx", "metadata"])
+    generate_metadata(root_dir, force=args.force_metadata)
 
     # 2. Convert YAML to Wiki.js Markdown
     print("\n--- Step 2: Converting YAML to Wiki.js Markdown ---")
     yml_dir = root_dir / "api"
     out_dir = root_dir / "wikijs_out"
 
-    # Using the current python interpreter
-    python_exe = sys.executable
-
-    cmd = [
-        python_exe,
-        "-m",
-        "src.docfx_yml_to_wikijs",
+    convert_args = [
         str(yml_dir),
         str(out_dir),
         "--include-namespace-pages",
@@ -89,20 +149,29 @@ def main() -> None:
         "--home-page",
         "--api-root",
         "/api",
+        "--skip-unchanged",
+        "--yaml-cache",
+        str(root_dir / YAML_CACHE_DIR),
     ]
 
     if args.dry_run:
-        cmd.append("--dry-run")
+        convert_args.append("--dry-run")
     if args.force_rebuild:
-        cmd.append("--force-rebuild")
+        convert_args.append("--force-rebuild")
+    if args.refresh_yaml_cache:
+        convert_args.append("--refresh-yaml-cache")
     if args.prune_stale:
-        cmd.append("--prune-stale")
+        convert_args.append("--prune-stale")
     if args.accept_legacy_cache:
-        cmd.append("--accept-legacy-cache")
+        convert_args.append("--accept-legacy-cache")
     if args.config:
-        cmd.extend(["--config", args.config])
+        convert_args.extend(["--config", args.config])
 
-    run_command(cmd)
+    # Run the converter in-process rather than paying for a second interpreter
+    print(f"Converting: {' '.join(convert_args)}")
+    exit_code = convert_yml_to_wikijs(convert_args)
+    if exit_code:
+        sys.exit(exit_code)
 
     print(f"\nSUCCESS: Documentation generated in {out_dir}")
 
@@ -4,36 +4,61 @@ set -euo pipefail
 repo_root="$(cd "$(dirname "$0")/.." && pwd)"
 cd "${repo_root}"
 
-run_step () {
+# Resolve and sync the environment once (precompiling .pyc files so the
+# concurrent tool startups don't each pay for it), then run every tool against
+# it with --no-sync so each step skips uv's resolver/sync pass.
+uv sync --project "${repo_root}" --frozen --compile-bytecode --quiet
+
+run_tool () {
+  uv run --project "${repo_root}" --directory "${repo_root}" --no-sync "$@"
+}
+
+log_dir="$(mktemp -d)"
+trap 'rm -rf "${log_dir}"' EXIT
+
+step_names=()
+step_pids=()
+
+# All checks below are read-only, so they run concurrently. Output is buffered
+# per step and replayed in order once every step has finished.
+start_step () {
   local name="$1"
   shift
-  echo
-  echo "Running ${name}..."
-  "$@"
-  echo "✅ ${name} passed"
+  local index="${#step_names[@]}"
+  step_names+=("${name}")
+  "$@" >"${log_dir}/${index}.log" 2>&1 &
+  step_pids+=("$!")
 }
 
 echo "Running read-only CI checks..."
 
-run_step \
-  "ruff format (check)" \
-  uv run --project "${repo_root}" --directory "${repo_root}" ruff format --check
-
-run_step \
-  "ruff check" \
-  uv run --project "${repo_root}" --directory "${repo_root}" ruff check
-
-run_step \
-  "mypy" \
-  uv run --project "${repo_root}" --directory "${repo_root}" mypy .
+start_step "ruff format (check)" run_tool ruff format --check
+start_step "ruff check" run_tool ruff check
+start_step "mypy" run_tool mypy .
+start_step "semgrep" run_tool semgrep scan --config=auto --quiet --error
+start_step "pytest" run_tool pytest
 
-run_step \
-  "semgrep" \
-  uv run --project "${repo_root}" --directory "${repo_root}" semgrep scan --config=auto --quiet --error
+failed=0
+for index in "${!step_names[@]}"; do
+  name="${step_names[${index}]}"
+  echo
+  echo "Running ${name}..."
+  status=0
+  wait "${step_pids[${index}]}" || status=$?
+  cat "${log_dir}/${index}.log"
+  if [[ "${status}" -eq 0 ]]; then
+    echo "✅ ${name} passed"
+  else
+    echo "❌ ${name} failed (exit ${status})"
+    failed=1
+  fi
+done
 
-run_step \
-  "pytest" \
-  uv run --project "${repo_root}" --directory "${repo_root}" pytest
+if [[ "${failed}" -ne 0 ]]; then
+  echo
+  echo "Some checks failed."
+  exit 1
+fi
 
 echo
 echo "All checks passed."
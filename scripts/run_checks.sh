@@ -32,11 +32,13 @@ done
 # -----------------------------------------------------------------------------
 
 echo "Running lint formatting + autofixes (must be clean before read-only checks)..."
+uv sync --project "${repo_root}" --frozen --compile-bytecode --quiet
+
 echo "Running ruff format..."
-uv run --project "${repo_root}" --directory "${repo_root}" ruff format
+uv run --project "${repo_root}" --directory "${repo_root}" --no-sync ruff format
 
 echo "Running ruff fix (no-error mode)..."
-uv run --project "${repo_root}" --directory "${repo_root}" ruff check --exit-zero --fix --unsafe-fixes -q
+uv run --project "${repo_root}" --directory "${repo_root}" --no-sync ruff check --exit-zero --fix --unsafe-fixes -q
 
 echo "Formatting checks passed (no changes)."
 
@@ -44,7 +46,7 @@ echo "Formatting checks passed (no changes)."
 # 2) Run core CI gate checks (parallelized in ci-gate.sh)
 # -----------------------------------------------------------------------------
 
+# ci-gate.sh is the last step and reports its own pass/fail summary, so hand
+# the process over to it instead of forking and waiting.
 echo "Delegating to scripts/ci-gate.sh for core checks..."
-./scripts/ci-gate.sh
-
-echo "All checks passed."
+exec ./scripts/ci-gate.sh
@@ -1,6 +1,9 @@
 """Logic for analyzing metadata to identify common prefixes and suffixes."""
 
+import functools
+import heapq
 from collections import Counter
+from itertools import chain
 from typing import Any
 
 from src.item_info import ItemInfo
@@ -25,64 +28,63 @@ class Analyzer:
         self.metadata_index = metadata_index
         self.config = config
 
+        # Type names repeat heavily across a corpus; memoize the per-name work.
+        # Cached token lists are shared, so callers must not mutate them.
+        self._tokenize = functools.lru_cache(maxsize=8192)(tokenizer.tokenize)
+        self._normalize = functools.lru_cache(maxsize=8192)(sanitizer.normalize)
+
         self.prefix_counts: Counter[str] = Counter()
         self.suffix_counts: Counter[str] = Counter()
         self.base_class_counts: Counter[str] = Counter()
 
         # Normalize stop tokens
         raw_stop = config.get("rules", {}).get("stop_tokens", [])
-        self.stop_tokens = {sanitizer.normalize(t) for t in raw_stop}
+        self.stop_tokens = frozenset(sanitizer.normalize(t) for t in raw_stop)
 
         self.global_items: list[str] = []
 
     def analyze(self, items: list[ItemInfo]) -> None:
-        """Analyze a list of ItemInfo objects."""
-        self.global_items = []
-        # Clear counters? Or accumulator?
-        # Assuming analyze is called once.
-
-        for item in items:
-            ns = getattr(item, "namespace", None)
-            if not ns or ns == "Global":
-                self.global_items.append(item.uid)
-                self._process_item(item)
-
-    def _process_item(self, item: ItemInfo) -> None:
-        """Process a single ItemInfo to update frequency counts."""
-        name = item.name
-        tokens = self.tokenizer.tokenize(name)
-
-        if not tokens:
-            return
-
-        # Prefix
-        prefix = self.sanitizer.normalize(tokens[0])
-        self.prefix_counts[prefix] += 1
-
-        # Suffix
-        suffix = self.sanitizer.normalize(tokens[-1])
-        self.suffix_counts[suffix] += 1
-
-        # Base Class
-        base = self.metadata_index.get_base_class(item.uid)
-        if base:
-            self.base_class_counts[base] += 1
-
-        # Interfaces
-        for iface in self.metadata_index.get_interfaces(item.uid):
-            self.base_class_counts[iface] += 1
+        """Analyze a list of ItemInfo objects.
+
+        Counts are gathered in bulk: each counter is fed one iterator through
+        Counter.update rather than being incremented per item.
+        """
+        global_items = [
+            item
+            for item in items
+            if not getattr(item, "namespace", None) or item.namespace == "Global"
+        ]
+        self.global_items = [item.uid for item in global_items]
+
+        # Items whose names yield no tokens are not counted at all.
+        tokenized = [
+            (item.uid, tokens)
+            for item in global_items
+            if (tokens := self._tokenize(item.name))
+        ]
+        uids = [uid for uid, _tokens in tokenized]
+
+        self.prefix_counts.update(
+            map(self._normalize, (tokens[0] for _uid, tokens in tokenized))
+        )
+        self.suffix_counts.update(
+            map(self._normalize, (tokens[-1] for _uid, tokens in tokenized))
+        )
+        bases = filter(None, map(self.metadata_index.get_base_class, uids))
+        interfaces = chain.from_iterable(map(self.metadata_index.get_interfaces, uids))
+        self.base_class_counts.update(chain(bases, interfaces))
 
     def get_top_prefixes(self, k: int, min_size: int) -> list[str]:
         """Return the top k prefixes occurring at least min_size times."""
-        candidates = []
-        for token, count in self.prefix_counts.items():
-            if count >= min_size and token not in self.stop_tokens:
-                candidates.append((token, count))
-
-        # Sort by count DESC, then token ASC
-        candidates.sort(key=lambda x: (-x[1], x[0]))
-
-        return [c[0] for c in candidates[:k]]
+        candidates = [
+            (-count, token)
+            for token, count in self.prefix_counts.items()
+            if count >= min_size and token not in self.stop_tokens
+        ]
+
+        # Smallest (-count, token) first: count DESC, then token ASC. A k-sized
+        # heap avoids sorting the whole prefix universe when k is small.
+        return [token for _neg_count, token in heapq.nsmallest(k, candidates)]
 
     def get_strong_suffixes(self, min_size: int) -> set[str]:
         """Return suffixes occurring at least min_size times."""
@@ -2,11 +2,28 @@
 
 
 def as_text(v: object) -> str:
-    """Convert a value to a string, handling lists and None."""
+    """Convert a value to a string, handling lists and None.
+
+    Nested lists are flattened iteratively; non-empty leaves are joined with
+    newlines.
+    """
     if v is None:
         return ""
     if isinstance(v, str):
         return v.strip()
-    if isinstance(v, list):
-        return "\n".join(as_text(x) for x in v if as_text(x))
-    return str(v).strip()
+    if not isinstance(v, list):
+        return str(v).strip()
+
+    lines: list[str] = []
+    stack = [iter(v)]
+    while stack:
+        for x in stack[-1]:
+            if isinstance(x, list):
+                stack.append(iter(x))
+                break
+            text = as_text(x)
+            if text:
+                lines.append(text)
+        else:
+            stack.pop()
+    return "\n".join(lines)
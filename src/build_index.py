@@ -1,41 +1,144 @@
 """Logic for building an index of UIDs from YAML files."""
 
+import contextlib
+import functools
+import os
+import sys
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
 from src.as_text import as_text
 from src.item_info import ItemInfo
 from src.iter_main_items import iter_main_items
-from src.load_managed_reference import load_managed_reference
+from src.load_managed_reference import PARSE_CACHE_ENTRY_RE, load_managed_reference
+
+# Below this many files, worker start-up costs more than the parallel parse saves.
+PARALLEL_MIN_FILES = 64
+
+# Touched at the start of each run; cache entries older than it were not used.
+CACHE_RUN_MARKER = "last-run"
 
 
 def build_index(
     yml_files: list[Path],
+    max_workers: int | None = None,
+    cache_dir: Path | None = None,
+    *,
+    refresh_cache: bool = False,
 ) -> tuple[dict[str, ItemInfo], dict[str, dict[str, Any]]]:
-    """Index all DocFX YAML files to build a map of UIDs to items and references."""
+    """Index all DocFX YAML files to build a map of UIDs to items and references.
+
+    Files are parsed in worker processes when there are enough of them to pay
+    for it; otherwise a thread pool overlaps the blocking file reads with
+    parsing. Results are merged in input order, so later files still win.
+    cache_dir and refresh_cache are passed on to load_managed_reference; cache
+    entries that this run neither read nor wrote are deleted afterwards.
+    """
     uid_to_item: dict[str, ItemInfo] = {}
     uid_to_ref: dict[str, dict[str, Any]] = {}
-    for f in yml_files:
-        doc = load_managed_reference(f)
-        for it in iter_main_items(doc):
-            uid = str(it.get("uid"))
-            kind = str(it.get("type") or "").strip() or "Unknown"
-            name = it.get("name") or it.get("fullName") or uid
-            full_name = it.get("fullName") or it.get("name") or uid
-            parent = it.get("parent")
-            ns = it.get("namespace")
-            summary = as_text(it.get("summary"))
-
-            inheritance = [
-                str(x.get("uid") if isinstance(x, dict) else x)
-                for x in (it.get("inheritance") or [])
-            ]
-            implements = [
-                str(x.get("uid") if isinstance(x, dict) else x)
-                for x in (it.get("implements") or [])
-            ]
-
-            uid_to_item[uid] = ItemInfo(
+    parse = functools.partial(
+        _parse_file, cache_dir=cache_dir, refresh_cache=refresh_cache
+    )
+    run_started = _mark_cache_run(cache_dir) if cache_dir is not None else None
+    workers = max_workers or os.cpu_count() or 1
+    if workers > 1 and len(yml_files) >= PARALLEL_MIN_FILES:
+        chunksize = max(1, len(yml_files) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            _merge(
+                executor.map(parse, yml_files, chunksize=chunksize),
+                uid_to_item,
+                uid_to_ref,
+            )
+    elif workers > 1 and len(yml_files) > 1:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            _merge(executor.map(parse, yml_files), uid_to_item, uid_to_ref)
+    else:
+        _merge(map(parse, yml_files), uid_to_item, uid_to_ref)
+    if cache_dir is not None and run_started is not None:
+        _prune_cache(cache_dir, run_started)
+    return uid_to_item, uid_to_ref
+
+
+def _mark_cache_run(cache_dir: Path) -> float:
+    """Touch the run marker and return its mtime, as the filesystem records it.
+
+    Comparing entries against the marker rather than the wall clock keeps the
+    check correct on filesystems with coarse timestamps.
+    """
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    marker = cache_dir / CACHE_RUN_MARKER
+    marker.touch()
+    return marker.stat().st_mtime
+
+
+def _prune_cache(cache_dir: Path, run_started: float) -> None:
+    """Delete cache entries and leftover temp files not touched by this run.
+
+    Only files named like the ones load_managed_reference writes are
+    considered, so pointing the cache at a directory holding other files is safe.
+    """
+    for entry in cache_dir.iterdir():
+        if not PARSE_CACHE_ENTRY_RE.match(entry.name):
+            continue
+        with contextlib.suppress(FileNotFoundError):
+            if entry.stat().st_mtime < run_started:
+                entry.unlink()
+
+
+def _merge(
+    parsed: Iterable[tuple[list[ItemInfo], list[dict[str, Any]]]],
+    uid_to_item: dict[str, ItemInfo],
+    uid_to_ref: dict[str, dict[str, Any]],
+) -> None:
+    """Merge per-file parse results into the UID maps.
+
+    UIDs, parents and namespaces are interned here, in the parent process, so
+    the many repeated lookups across the pipeline share one string each.
+    """
+    intern = sys.intern
+    for items, refs in parsed:
+        for item in items:
+            item.uid = intern(item.uid)
+            if item.parent:
+                item.parent = intern(item.parent)
+            if item.namespace:
+                item.namespace = intern(item.namespace)
+            uid_to_item[item.uid] = item
+        for ref in refs:
+            uid_to_ref[intern(str(ref["uid"]))] = ref
+
+
+def _parse_file(
+    f: Path,
+    cache_dir: Path | None = None,
+    *,
+    refresh_cache: bool = False,
+) -> tuple[list[ItemInfo], list[dict[str, Any]]]:
+    """Parse one YAML file into its items and references."""
+    doc = load_managed_reference(f, cache_dir, refresh_cache=refresh_cache)
+    items: list[ItemInfo] = []
+    for it in iter_main_items(doc):
+        uid = str(it.get("uid"))
+        kind = str(it.get("type") or "").strip() or "Unknown"
+        name = it.get("name") or it.get("fullName") or uid
+        full_name = it.get("fullName") or it.get("name") or uid
+        parent = it.get("parent")
+        ns = it.get("namespace")
+        summary = as_text(it.get("summary"))
+
+        inheritance = [
+            str(x.get("uid") if isinstance(x, dict) else x)
+            for x in (it.get("inheritance") or [])
+        ]
+        implements = [
+            str(x.get("uid") if isinstance(x, dict) else x)
+            for x in (it.get("implements") or [])
+        ]
+
+        items.append(
+            ItemInfo(
                 uid=uid,
                 kind=kind,
                 name=str(name),
@@ -48,7 +151,10 @@ def build_index(
                 file=f,
                 raw=it,
             )
-        for ref in doc.get("references") or []:
-            if isinstance(ref, dict) and ref.get("uid"):
-                uid_to_ref[str(ref["uid"])] = ref
-    return uid_to_item, uid_to_ref
+        )
+    refs = [
+        ref
+        for ref in doc.get("references") or []
+        if isinstance(ref, dict) and ref.get("uid")
+    ]
+    return items, refs
@@ -78,26 +78,42 @@ def _add_reference_targets(
     uid_to_ref: dict[str, dict[str, Any]],
 ) -> None:
     """Add targets from external or internal references."""
-    # Pass 1: Direct hrefs and initial population
+    # Direct hrefs first; everything else resolves through its definition chain.
+    pending: dict[str, dict[str, Any]] = {}
     for uid, ref in uid_to_ref.items():
         if uid in targets:
             continue
         href = ref.get("href")
-        title = ref.get("name") or ref.get("fullName") or uid
         if href:
+            title = ref.get("name") or ref.get("fullName") or uid
             targets[uid] = LinkTarget(title=str(title), page_path=str(href))
         else:
-            targets[uid] = LinkTarget(title=str(title), page_path="#")
+            pending[uid] = ref
 
-    # Pass 2: Resolve via definition for those still without a real page_path (i.e. "#")
-    for uid, ref in uid_to_ref.items():
-        if targets[uid].page_path == "#":
-            definition = ref.get("definition")
-            if definition and str(definition) in targets:
-                d_target = targets[str(definition)]
-                if d_target.page_path != "#":
-                    # Use definition's title if our title is just the UID
-                    title = targets[uid].title
-                    if title == uid:
-                        title = d_target.title
-                    targets[uid] = LinkTarget(title=title, page_path=d_target.page_path)
+    for uid in pending:
+        if uid in targets:
+            continue
+        # Walk down the definition chain to the first UID that already has a
+        # target (or a dead end), then assign targets back up the chain so later
+        # walks stop as soon as they reach any of these UIDs.
+        chain: list[str] = []
+        seen: set[str] = set()
+        current: str | None = uid
+        while current in pending and current not in targets and current not in seen:
+            chain.append(current)
+            seen.add(current)
+            definition = pending[current].get("definition")
+            current = str(definition) if definition else None
+
+        base = targets.get(current) if current is not None else None
+        for link_uid in reversed(chain):
+            ref = pending[link_uid]
+            title = str(ref.get("name") or ref.get("fullName") or link_uid)
+            if base and base.page_path != "#":
+                # Use definition's title if our title is just the UID
+                if title == link_uid:
+                    title = base.title
+                base = LinkTarget(title=title, page_path=base.page_path)
+            else:
+                base = LinkTarget(title=title, page_path="#")
+            targets[link_uid] = base
@@ -0,0 +1,15 @@
+"""Logic for grouping member items under their declaring type."""
+
+from src.is_member_kind import is_member_kind
+from src.item_info import ItemInfo
+
+
+def build_members_by_parent(
+    uid_to_item: dict[str, ItemInfo],
+) -> dict[str, list[ItemInfo]]:
+    """Map each parent UID to its member items, in index order."""
+    members_by_parent: dict[str, list[ItemInfo]] = {}
+    for it in uid_to_item.values():
+        if it.parent and is_member_kind(it.kind):
+            members_by_parent.setdefault(it.parent, []).append(it)
+    return members_by_parent
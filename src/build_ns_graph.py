@@ -4,16 +4,26 @@ from src.item_info import ItemInfo
 
 
 def build_ns_graph(ns_to_types: dict[str, list[ItemInfo]]) -> dict[str, set[str]]:
-    """Build a mapping of namespace to its child namespaces."""
+    """Build a mapping of namespace to its child namespaces.
+
+    Intermediate namespaces without types of their own are linked too, and every
+    root namespace gets an entry even if it has no children.
+    """
     ns_children: dict[str, set[str]] = {}
-    all_namespaces = set(ns_to_types.keys())
-    for ns in list(all_namespaces):
+    for ns in ns_to_types:
         if not ns:
             continue
-        parts = ns.split(".")
-        for i in range(1, len(parts)):
-            parent = ".".join(parts[:i])
-            child = ".".join(parts[: i + 1])
-            ns_children.setdefault(parent, set()).add(child)
-        ns_children.setdefault(parts[0], ns_children.get(parts[0], set()))
+        # Walk up one level at a time; once an edge already exists, every
+        # ancestor above it has been linked by an earlier namespace.
+        child = ns
+        parent, _, _ = child.rpartition(".")
+        while parent:
+            siblings = ns_children.setdefault(parent, set())
+            if child in siblings:
+                break
+            siblings.add(child)
+            child = parent
+            parent, _, _ = child.rpartition(".")
+        else:
+            ns_children.setdefault(child, set())
     return ns_children
@@ -1,12 +1,18 @@
 """Logic for generating reports on global namespace resolution."""
 
 import json
+import sys
 import time
+from collections import Counter
 from pathlib import Path
+from statistics import median
 from typing import Any
 
 from src.resolution_result import ResolutionResult
 
+# Rules that reuse an existing placement; they never count as reroutes.
+NON_REROUTE_RULES = frozenset({"cache", "override"})
+
 
 class ClusterReport:
     """Collects and summarizes the results of global namespace path resolution."""
@@ -17,17 +23,42 @@ class ClusterReport:
         self.schema_version = schema_version
         self.results: list[ResolutionResult] = []
         self.start_time = time.time()
+        self._start_perf = time.perf_counter()
+
+        # Running tallies, updated per result so reporting needs no re-scan.
+        self._rule_counts: Counter[str] = Counter()
+        self._folder_counts: Counter[str] = Counter()
+        self._rerouted_count = 0
+        self._unmapped_count = 0
 
     def add_result(self, result: ResolutionResult) -> None:
         """Add a single resolution result to the report."""
         self.results.append(result)
+        rule = result.winning_rule
+        self._rule_counts[rule] += 1
+
+        # Extract top-level root
+        # Roots repeat across many results; interning shares one string per
+        # root and makes equal-root comparisons an identity check.
+        parts = result.final_path.split("/", 2)
+        final_root = sys.intern(parts[1]) if len(parts) > 1 else ""
+        if len(parts) > 1:
+            self._folder_counts[final_root] += 1
+
+        # Reroute stats (unmapped only)
+        if rule not in NON_REROUTE_RULES:
+            self._unmapped_count += 1
+            # If final top-level root differs from initial
+            initial_root = sys.intern(result.initial_root)
+            if initial_root and final_root and initial_root != final_root:
+                self._rerouted_count += 1
 
     def generate_report(self, path: str, max_folder_size: int = 250) -> None:
         """Write the summary report to a JSON file."""
         report = {
             "meta": {
                 "timestamp": time.time(),
-                "duration": time.time() - self.start_time,
+                "duration": time.perf_counter() - self._start_perf,
                 "config_hash": self.config_hash,
                 "schema_version": self.schema_version,
                 "total_items": len(self.results),
@@ -47,74 +78,50 @@ class ClusterReport:
             "stats": self._compute_stats(max_folder_size),
         }
 
-        Path(path).write_text(json.dumps(report, indent=2), encoding="utf-8")
+        # One-shot json.dumps uses the C encoder (indent included since 3.13);
+        # json.dump falls back to the pure-Python iterencode.
+        Path(path).write_bytes(json.dumps(report, indent=2).encode("utf-8"))
 
     def _compute_stats(self, max_folder_size: int) -> dict[str, Any]:
-        rule_counts: dict[str, int] = {}
-        folder_counts: dict[str, int] = {}
-
-        rerouted_count = 0
-        unmapped_count = 0
-
-        for r in self.results:
-            rule_counts[r.winning_rule] = rule_counts.get(r.winning_rule, 0) + 1
-
-            # Extract top-level root
-            parts = r.final_path.split("/")
-            if len(parts) > 1:
-                root = parts[1]
-                folder_counts[root] = folder_counts.get(root, 0) + 1
-
-            # Reroute stats (unmapped only)
-            if r.winning_rule not in {"cache", "override"}:
-                unmapped_count += 1
-                # If final top-level root differs from initial
-                initial_root = r.initial_root
-                final_root = parts[1] if len(parts) > 1 else ""
-                if initial_root and final_root and initial_root != final_root:
-                    rerouted_count += 1
+        folder_counts = dict(self._folder_counts)
+        rerouted_count = self._rerouted_count
+        unmapped_count = self._unmapped_count
 
         total_items = len(self.results)
         num_folders = len(folder_counts)
-        singleton_folders = [f for f, c in folder_counts.items() if c == 1]
+
+        # Single pass over the folders for every per-folder tally.
+        fragmentation_threshold = 3
+        singleton_count = 0
+        small_count = 0  # Fragmentation: folders with < 3 items
+        largest = 0
+        capacity_constraint_ok = True
+        for f, c in folder_counts.items():
+            if c == 1:
+                singleton_count += 1
+            largest = max(largest, c)
+            if f == "Misc":
+                continue
+            if c < fragmentation_threshold:
+                small_count += 1
+            if c > max_folder_size:
+                capacity_constraint_ok = False
 
         misc_share = (
             (folder_counts.get("Misc", 0) / total_items) if total_items > 0 else 0
         )
-        singleton_rate = (
-            (len(singleton_folders) / num_folders) if num_folders > 0 else 0
-        )
+        singleton_rate = (singleton_count / num_folders) if num_folders > 0 else 0
         reroute_share = (rerouted_count / unmapped_count) if unmapped_count > 0 else 0
 
-        # Fragmentation: % of folders with < 3 items
-        fragmentation_threshold = 3
-        small_folders = [
-            f
-            for f, c in folder_counts.items()
-            if c < fragmentation_threshold and f != "Misc"
-        ]
-        fragmentation = (
-            (len(small_folders) / (num_folders - (1 if "Misc" in folder_counts else 0)))
-            if (num_folders > (1 if "Misc" in folder_counts else 0))
-            else 0
-        )
+        # Misc is excluded from the fragmentation denominator.
+        non_misc_folders = num_folders - (1 if "Misc" in folder_counts else 0)
+        fragmentation = (small_count / non_misc_folders) if non_misc_folders > 0 else 0
 
         # Nav Friction: Median files per top-level folder
-        sorted_counts = sorted(folder_counts.values())
-        median_files: float = 0.0
-        if sorted_counts:
-            mid = len(sorted_counts) // 2
-            if len(sorted_counts) % 2 == 0:
-                median_files = (sorted_counts[mid - 1] + sorted_counts[mid]) / 2
-            else:
-                median_files = sorted_counts[mid]
-
-        capacity_constraint_ok = all(
-            c <= max_folder_size for f, c in folder_counts.items() if f != "Misc"
-        )
+        median_files: float = median(folder_counts.values()) if folder_counts else 0.0
 
         return {
-            "rule_counts": rule_counts,
+            "rule_counts": dict(self._rule_counts),
             "folder_counts": folder_counts,
             "metrics": {
                 "total_folders": num_folders,
@@ -124,8 +131,6 @@ class ClusterReport:
                 "fragmentation": fragmentation,
                 "median_files_per_folder": median_files,
                 "capacity_constraint_ok": capacity_constraint_ok,
-                "largest_folder_size": max(folder_counts.values())
-                if folder_counts
-                else 0,
+                "largest_folder_size": largest,
             },
         }
@@ -1,5 +1,7 @@
 """Logic for deep merging configuration dictionaries."""
 
+import heapq
+from itertools import groupby
 from typing import Any
 
 
@@ -9,23 +11,54 @@ def deep_merge(base: dict[str, Any], update: dict[str, Any]) -> dict[str, Any]:
     - Objects are merged recursively.
     - Arrays in 'update' replace 'base' arrays, EXCEPT for specific keys.
     - 'acronyms' is additive.
+
+    Nested objects are merged with an explicit stack rather than recursion.
+    Only the subtrees touched by 'update' are copied; 'base' is never mutated.
     """
+    # Pure overrides (no nested dict or acronyms key shared with base) need no
+    # per-key work; a single dict union is enough.
+    if not _needs_walk(base, update):
+        return base | update
+
     result = base.copy()
-    for key, value in update.items():
-        if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-            result[key] = deep_merge(result[key], value)
-        elif (
-            key == "acronyms"
-            and isinstance(value, list)
-            and isinstance(result.get(key), list)
-        ):
-            # Additive merge for acronyms, deduplicated and sorted
-            base_list = result[key]
-            # Ensure both are list of strings
-            merged_set = set(base_list)
-            merged_set.update(value)
-            result[key] = sorted(merged_set)
-        else:
-            # Default: Replacement (scalars and other arrays)
-            result[key] = value
+    stack = [(result, update)]
+    while stack:
+        dest, src = stack.pop()
+        for key, value in src.items():
+            if key in dest and isinstance(dest[key], dict) and isinstance(value, dict):
+                if _needs_walk(dest[key], value):
+                    child = dest[key].copy()
+                    dest[key] = child
+                    stack.append((child, value))
+                else:
+                    dest[key] = dest[key] | value
+            elif (
+                key == "acronyms"
+                and isinstance(value, list)
+                and isinstance(dest.get(key), list)
+            ):
+                # Additive merge for acronyms, deduplicated and sorted
+                dest[key] = _sorted_union(dest[key], value)
+            else:
+                # Default: Replacement (scalars and other arrays)
+                dest[key] = value
     return result
+
+
+def _needs_walk(base: dict[str, Any], update: dict[str, Any]) -> bool:
+    """Return True if merging 'update' into 'base' needs more than a union."""
+    return any(
+        key in base and (key == "acronyms" or isinstance(value, dict))
+        for key, value in update.items()
+    )
+
+
+def _sorted_union(base_list: list[Any], values: list[Any]) -> list[Any]:
+    """Return the sorted, deduplicated union of two lists.
+
+    The base list is normally already sorted from an earlier merge, so sorting
+    it again is linear; merging then dropping adjacent repeats avoids building
+    hash sets.
+    """
+    merged = heapq.merge(sorted(base_list), sorted(values))
+    return [k for k, _group in groupby(merged)]
@@ -1,13 +1,17 @@
 """Main entry point for DocFX YAML to Wiki.js conversion."""
 
 import argparse
+from collections.abc import Sequence
 from pathlib import Path
 
 from src.run_conversion import run_conversion
 
 
-def main() -> int:
-    """Run the conversion process."""
+def main(argv: Sequence[str] | None = None) -> int:
+    """Run the conversion process.
+
+    argv defaults to sys.argv[1:], so callers can run it in-process.
+    """
     ap = argparse.ArgumentParser(
         description=(
             "Convert DocFX ManagedReference YAML to Wiki.js Markdown (DocFX-ish "
@@ -68,7 +72,29 @@ def main() -> int:
         action="store_true",
         help="Accept and migrate legacy cache formats",
     )
-    args = ap.parse_args()
+    ap.add_argument(
+        "--skip-unchanged",
+        action="store_true",
+        help="Leave output files untouched when their content is unchanged",
+    )
+    ap.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        help="Worker count for parsing YAML files (default: CPU count; 1 = serial)",
+    )
+    ap.add_argument(
+        "--yaml-cache",
+        type=Path,
+        default=None,
+        help="Directory for caching parsed YAML between runs (default: no cache)",
+    )
+    ap.add_argument(
+        "--refresh-yaml-cache",
+        action="store_true",
+        help="Re-parse every YAML file and rewrite its --yaml-cache entry",
+    )
+    args = ap.parse_args(argv)
     return run_conversion(args)
 
 
@@ -4,6 +4,9 @@ import re
 
 # Conservative: keep letters, digits, underscore, dash. Dots are replaced with hyphens.
 DOT_SAFE_RE = re.compile(r"[^A-Za-z0-9_-]+")
+# Nested types Outer+Inner -> Outer-Inner, generics Foo`1 -> Foo1-ish, and
+# dots -> hyphens for Wiki.js compatibility, all in one pass.
+DOT_SAFE_TABLE = str.maketrans({"+": "-", "`": None, ".": "-"})
 
 
 def dot_safe(name: str) -> str:
@@ -12,9 +15,6 @@ def dot_safe(name: str) -> str:
     Replaces dots with hyphens for Wiki.js compatibility. Also normalize nested types
     and generics markers.
     """
-    name = name.replace("+", "-")  # nested types Outer+Inner -> Outer-Inner
-    name = name.replace("`", "")  # generics Foo`1 -> Foo1-ish
-    name = name.replace(".", "-")  # dots -> hyphens for Wiki.js compatibility
-    name = DOT_SAFE_RE.sub("-", name).strip("-")
+    name = DOT_SAFE_RE.sub("-", name.translate(DOT_SAFE_TABLE)).strip("-")
     # Avoid pathological emptiness
     return name or "Unknown"
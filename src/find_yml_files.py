@@ -0,0 +1,22 @@
+"""Logic for discovering DocFX YAML files under a directory."""
+
+import os
+from pathlib import Path
+
+
+def find_yml_files(root: Path) -> list[Path]:
+    """Return every *.yml file below root, sorted like sorted(root.rglob(...)).
+
+    Walks the tree with os.scandir, which reuses the directory entries' cached
+    type information, and only builds Path objects for the files it returns.
+    """
+    found: list[str] = []
+    stack = [os.fspath(root)]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.endswith(".yml"):
+                    found.append(entry.path)
+    return sorted(map(Path, found))
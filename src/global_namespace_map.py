@@ -2,6 +2,7 @@
 
 import json
 import logging
+from collections.abc import Iterable
 from pathlib import Path
 from typing import Any
 
@@ -10,6 +11,13 @@ logger = logging.getLogger(__name__)
 CURRENT_SCHEMA_VERSION = 1
 
 
+def _as_run_id(value: object) -> int:
+    """Return value as a run id, treating anything but a plain int as run 0."""
+    if isinstance(value, int) and not isinstance(value, bool):
+        return value
+    return 0
+
+
 class GlobalNamespaceMap:
     """Manages a persistent cache of UID to file path mappings for global items."""
 
@@ -17,7 +25,10 @@ class GlobalNamespaceMap:
         """Initialize the map with a storage path and current configuration hash."""
         self.path = Path(path)
         self.current_config_hash = current_config_hash
-        self.mapping: dict[str, dict[str, Any]] = {}  # uid -> {path, last_seen}
+        # Entries are stored as two flat dicts rather than a dict per UID; the
+        # on-disk layout is still uid -> {path, last_seen}.
+        self.paths: dict[str, str] = {}
+        self.last_seen: dict[str, int] = {}
         self.meta: dict[str, Any] = {
             "schema_version": CURRENT_SCHEMA_VERSION,
             "config_hash": current_config_hash,
@@ -32,7 +43,7 @@ class GlobalNamespaceMap:
             return
 
         try:
-            data = json.loads(self.path.read_text(encoding="utf-8"))
+            data = json.loads(self.path.read_bytes())
 
             schema_ver = data.get("meta", {}).get("schema_version", 0)
 
@@ -46,51 +57,93 @@ class GlobalNamespaceMap:
                     return
                 logger.info("Accepting legacy cache. Will be migrated.")
 
-            self.meta = data.get("meta", {})
-            # Ensure meta has run_id
-            if "run_id" not in self.meta:
-                self.meta["run_id"] = 0
+            meta = data.get("meta", {})
+            # Ensure meta has a usable run_id
+            meta["run_id"] = _as_run_id(meta.get("run_id"))
 
             raw_mapping = data.get("mapping", {})
 
-            # Migrate mapping: string -> dict
+            # Migrate mapping: string -> dict. Entries are collected locally
+            # so a failure part-way through never leaves a half-loaded map.
+            run_id = meta["run_id"]
+            paths: dict[str, str] = {}
+            last_seen: dict[str, int] = {}
+            skipped = False
             for uid, val in raw_mapping.items():
-                if isinstance(val, str):
-                    self.mapping[uid] = {"path": val, "last_seen": self.meta["run_id"]}
+                if isinstance(val, str) and val:
+                    paths[uid] = val
+                    last_seen[uid] = run_id
+                elif (
+                    isinstance(val, dict)
+                    and isinstance(val.get("path"), str)
+                    and val["path"]
+                ):
+                    paths[uid] = val["path"]
+                    last_seen[uid] = _as_run_id(val.get("last_seen"))
                 else:
-                    self.mapping[uid] = val
+                    logger.warning("Skipping invalid cache entry for %s", uid)
+                    skipped = True
+            self.meta = meta
+            self.paths = paths
+            self.last_seen = last_seen
+            # The file no longer matches memory, so the next save rewrites it.
+            self.dirty = skipped
 
         except Exception:
             logger.exception("Error loading cache")
 
     def lookup(self, uid: str) -> str | None:
         """Return the cached path for a UID, marking it as accessed."""
-        entry = self.mapping.get(uid)
-        if entry:
+        path = self.paths.get(uid)
+        if path is not None:
             self.accessed_uids.add(uid)
-            return entry.get("path")
-        return None
+        return path
 
     def update(self, uid: str, path: str) -> None:
         """Update or add a mapping for a UID."""
         # We don't verify if path changed here to set dirty?
         # Actually we should.
-        entry = self.mapping.get(uid)
-        if not entry:
-            self.mapping[uid] = {"path": path, "last_seen": 0}  # Placeholder
+        old_path = self.paths.get(uid)
+        if old_path is None:
+            self.paths[uid] = path
+            self.last_seen[uid] = 0  # Placeholder
             self.dirty = True
-        elif entry.get("path") != path:
-            entry["path"] = path
+        elif old_path != path:
+            self.paths[uid] = path
             self.dirty = True
 
         self.accessed_uids.add(uid)
 
+    def bulk_update(self, pairs: Iterable[tuple[str, str]]) -> None:
+        """Update or add mappings for many UIDs in a single pass."""
+        paths = self.paths
+        mark_accessed = self.accessed_uids.add
+        for uid, path in pairs:
+            mark_accessed(uid)
+            old_path = paths.get(uid)
+            if old_path == path:
+                continue
+            if old_path is None:
+                self.last_seen[uid] = 0  # Placeholder
+            paths[uid] = path
+            self.dirty = True
+
     def save(self, prune_stale_threshold: int = 0) -> None:
         """Save the cache to disk.
 
         Updates run_id and last_seen for accessed items.
         Prunes items not seen for > prune_stale_threshold runs.
+        A run that neither changed nor used any entry leaves the file as is.
         """
+        if (
+            not self.dirty
+            and not self.accessed_uids
+            and prune_stale_threshold == 0
+            and self.meta.get("config_hash") == self.current_config_hash
+            and self.path.exists()
+        ):
+            return
+
         # Increment run ID
         current_run_id = self.meta.get("run_id", 0) + 1
         self.meta["run_id"] = current_run_id
@@ -98,35 +151,39 @@ class GlobalNamespaceMap:
         self.meta["schema_version"] = CURRENT_SCHEMA_VERSION
 
         # Update last_seen for accessed items
-        for uid in self.accessed_uids:
-            if uid in self.mapping:
-                self.mapping[uid]["last_seen"] = current_run_id
+        live = self.accessed_uids & self.paths.keys()
+        self.last_seen.update(dict.fromkeys(live, current_run_id))
 
         # Prune
         if prune_stale_threshold > 0:
-            to_remove = []
-            for uid, entry in self.mapping.items():
-                last_seen = entry.get("last_seen", 0)
-                # If current_run_id is 10, and last_seen is 5. Age is 5.
-                # If threshold is 5, we keep it.
-                # If last_seen is 4. Age is 6. We prune.
-                if (current_run_id - last_seen) > prune_stale_threshold:
-                    to_remove.append(uid)
-
-            for uid in to_remove:
-                del self.mapping[uid]
+            # If current_run_id is 10, and last_seen is 5. Age is 5.
+            # If threshold is 5, we keep it.
+            # If last_seen is 4. Age is 6. We prune.
+            cutoff = current_run_id - prune_stale_threshold
+            seen = self.last_seen
+            kept = {
+                uid: path for uid, path in self.paths.items() if seen[uid] >= cutoff
+            }
+            removed = len(self.paths) - len(kept)
+            if removed:
+                self.paths = kept
+                self.last_seen = {uid: seen[uid] for uid in kept}
                 self.dirty = True
-                logger.info("Pruned stale UID: %s", uid)
+                logger.info("Pruned %d stale UIDs", removed)
 
         # Create directory if needed
         if not self.path.parent.exists():
             self.path.parent.mkdir(parents=True, exist_ok=True)
 
-        self.path.write_text(
-            json.dumps(
-                {"meta": self.meta, "mapping": self.mapping},
-                indent=2,
-                sort_keys=True,
-            ),
-            encoding="utf-8",
-        )
+        seen = self.last_seen
+        data = {
+            "meta": self.meta,
+            "mapping": {
+                uid: {"last_seen": seen[uid], "path": path}
+                for uid, path in self.paths.items()
+            },
+        }
+        # Write then rename so an interrupted save never leaves a partial map.
+        tmp = self.path.with_name(f"{self.path.name}.tmp")
+        tmp.write_text(json.dumps(data, indent=2, sort_keys=True), encoding="utf-8")
+        tmp.replace(self.path)
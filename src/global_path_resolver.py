@@ -1,7 +1,9 @@
 """Logic for resolving global namespace items into clustered file paths."""
 
-import hashlib
-from pathlib import Path
+import functools
+import zlib
+from collections.abc import Iterator
+from itertools import islice
 from typing import Any
 
 from src.analyzer import Analyzer
@@ -24,10 +26,15 @@ class GlobalPathResolver:
         self.sanitizer = analyzer.sanitizer
         self.metadata_index = analyzer.metadata_index
 
+        # Tokens repeat heavily across items; memoize their normalized form.
+        self._normalize = functools.lru_cache(maxsize=8192)(self.sanitizer.normalize)
+
         # State
         self.assigned_paths: dict[str, str] = {}  # uid -> path
-        self.path_registry: dict[str, str] = {}  # lower_canonical_path -> uid
-        self.folders: set[str] = set()  # lower_canonical_folder_path
+        # lower_canonical_path -> uid for files, None for folders
+        self.registry: dict[str, str | None] = {}
+        # (uid, path) pairs flushed to the global map once per resolve_all
+        self._pending_updates: list[tuple[str, str]] = []
 
         # Helper caches
         min_size = config["thresholds"]["min_cluster_size"]
@@ -37,18 +44,27 @@ class GlobalPathResolver:
             )
         )
         self.strong_suffixes = analyzer.get_strong_suffixes(min_size=min_size)
+        self.min_family_size = config["thresholds"].get("min_family_size", 3)
 
         self.priority_suffixes = set(config["rules"]["priority_suffixes"])
         self.keyword_clusters = config["rules"].get("keyword_clusters", {})
+        # normalized keyword -> (config position, bucket) of every bucket listing it
+        self._keyword_index: dict[str, list[tuple[int, str]]] = {}
+        for position, (bucket, keywords) in enumerate(self.keyword_clusters.items()):
+            for kw in {self._normalize(kw) for kw in keywords}:
+                self._keyword_index.setdefault(kw, []).append((position, bucket))
         self.metadata_denylist = set(config["rules"].get("metadata_denylist", []))
         self.hub_types = config.get("hub_types", {})
         self.acronyms = set(config.get("acronyms", []))
+        self.path_overrides = config.get("path_overrides", {})
+        # Keep only the winning rule; runner-ups then can't steer orphan rerouting.
+        self.first_match_wins = config["rules"].get("first_match_wins", False)
 
     def resolve_all(self, items: list[ItemInfo]) -> dict[str, ResolutionResult]:
         """Resolve all items at once, applying normalization pass."""
         # 1. Initial clustering
         items_by_uid = {it.uid: it for it in items}
-        initial_assignments, original_signals, cached_results = (
+        initial_assignments, original_signals, signal_by_key, cached_results = (
             self._apply_initial_clustering(items)
         )
 
@@ -61,65 +77,67 @@ class GlobalPathResolver:
         final_keys = norm_pass.run(to_normalize, items_by_uid, original_signals)
 
         # 3. Finalize
-        return self._finalize_results(
+        results = self._finalize_results(
             final_keys,
             items_by_uid,
-            original_signals,
+            signal_by_key,
             initial_assignments,
             cached_results,
         )
+        self.global_map.bulk_update(self._pending_updates)
+        self._pending_updates = []
+        return results
 
     def _apply_initial_clustering(
         self, items: list[ItemInfo]
     ) -> tuple[
         dict[str, tuple[str, str]],
         dict[str, list[tuple[str, str, float]]],
+        dict[str, dict[str, tuple[str, float]]],
         dict[str, ResolutionResult],
     ]:
         """Run initial rule application and separate cached items."""
         initial_assignments: dict[str, tuple[str, str]] = {}
         original_signals: dict[str, list[tuple[str, str, float]]] = {}
+        # uid -> cluster_key -> (rule_id, score) of the first rule proposing it
+        signal_by_key: dict[str, dict[str, tuple[str, float]]] = {}
         cached_results: dict[str, ResolutionResult] = {}
 
+        use_cache = not self.config.get("force_rebuild", False)
+        overrides = self.path_overrides
+        lookup = self.global_map.lookup
+
         for item in items:
             # 1.1 Cache Check
-            if not self.config.get("force_rebuild", False):
-                cached_path = self.global_map.lookup(item.uid)
+            if use_cache:
+                cached_path = lookup(item.uid)
                 if cached_path:
-                    cached_root = ""
-                    parts = cached_path.split("/")
-                    if len(parts) > 1:
-                        cached_root = parts[1]
+                    parts = cached_path.split("/", 2)
+                    cached_root = parts[1] if len(parts) > 1 else ""
 
                     cached_results[item.uid] = self._finalize_resolution(
                         item.uid, cached_path, ("cache", 1.0, "cache"), [], cached_root
                     )
                     continue
 
-            # 1.2 Overrides
-            overrides = self.config.get("path_overrides", {})
-            if item.uid in overrides:
-                cached_results[item.uid] = self._finalize_resolution(
-                    item.uid,
-                    overrides[item.uid],
-                    ("override_uid", 1.0, "override"),
-                    [],
-                    "",
-                )
-                continue
-            if item.full_name in overrides:
+            # 1.2 Overrides (by UID first, then by full name)
+            override_info = ("override_uid", 1.0, "override")
+            override = overrides.get(item.uid)
+            if override is None:
+                override_info = ("override_name", 1.0, "override")
+                override = overrides.get(item.full_name)
+            if override is not None:
                 cached_results[item.uid] = self._finalize_resolution(
-                    item.uid,
-                    overrides[item.full_name],
-                    ("override_name", 1.0, "override"),
-                    [],
-                    "",
+                    item.uid, override, override_info, [], ""
                 )
                 continue
 
             # 1.3 Apply Rules
             candidates = self._apply_rules(item)
             original_signals[item.uid] = candidates
+            signal_by_key[item.uid] = {
+                key: (rule_id, score) for rule_id, key, score in reversed(candidates)
+            }
 
             if not candidates:
                 initial_assignments[item.uid] = ("misc", "Misc")
@@ -127,13 +145,13 @@ class GlobalPathResolver:
                 winning = candidates[0]
                 initial_assignments[item.uid] = (winning[0], winning[1])
 
-        return initial_assignments, original_signals, cached_results
+        return initial_assignments, original_signals, signal_by_key, cached_results
 
     def _finalize_results(
         self,
         final_keys: dict[str, str],
         items_by_uid: dict[str, ItemInfo],
-        original_signals: dict[str, list[tuple[str, str, float]]],
+        signal_by_key: dict[str, dict[str, tuple[str, float]]],
         initial_assignments: dict[str, tuple[str, str]],
         cached_results: dict[str, ResolutionResult],
     ) -> dict[str, ResolutionResult]:
@@ -142,18 +160,14 @@ class GlobalPathResolver:
 
         for uid, cluster_key in final_keys.items():
             item = items_by_uid[uid]
-            rule_id = "normalized"
-            score = 0.5
 
             # Find the original rule that matched this cluster_key if possible
-            for r_id, k, s in original_signals.get(uid, []):
-                if k == cluster_key:
-                    rule_id = r_id
-                    score = s
-                    break
+            rule_id, score = signal_by_key.get(uid, {}).get(
+                cluster_key, ("normalized", 0.5)
+            )
 
             # Construct Path
-            safe_name = self.sanitizer.normalize(item.name)
+            safe_name = self._normalize(item.name)
             path = f"Global/{cluster_key}/{safe_name}.md"
 
             # Initial root for metrics
@@ -171,68 +185,64 @@ class GlobalPathResolver:
 
     def _apply_rules(self, item: ItemInfo) -> list[tuple[str, str, float]]:
         """Return list of (rule_id, cluster_key, score) in precedence order."""
-        candidates = []
+        matches = self._iter_rule_matches(item)
+        if self.first_match_wins:
+            return list(islice(matches, 1))
+        return list(matches)
 
+    def _iter_rule_matches(self, item: ItemInfo) -> Iterator[tuple[str, str, float]]:
+        """Yield matching rules lazily so later rules can be skipped."""
         tokens = self.analyzer.tokenizer.tokenize(item.name)
         if not tokens:
-            return []
+            return
 
-        norm_tokens = [self.sanitizer.normalize(t) for t in tokens]
+        norm_tokens = list(map(self._normalize, tokens))
+        first = norm_tokens[0]
+        last = norm_tokens[-1]
 
         # Rule 3: Metadata Hub (Score 0.95)
         hub_cand = self._check_metadata_hub(item)
         if hub_cand:
-            candidates.append(hub_cand)
+            yield hub_cand
 
         # Rule 4: Priority Suffixes (Score 0.9)
-        if norm_tokens:
-            last = norm_tokens[-1]
-            if last in self.priority_suffixes:
-                candidates.append(("priority_suffix", last, 0.9))
+        if last in self.priority_suffixes:
+            yield ("priority_suffix", last, 0.9)
 
         # Rule 5: Strong Prefix (Score 0.8)
-        if norm_tokens:
-            first = norm_tokens[0]
-            if first in self.top_prefixes:
-                candidates.append(("strong_prefix", first, 0.8))
+        if first in self.top_prefixes:
+            yield ("strong_prefix", first, 0.8)
 
         # Rule 6: Strong Suffix (Score 0.7)
-        if norm_tokens:
-            last = norm_tokens[-1]
-            if last in self.strong_suffixes:
-                candidates.append(("strong_suffix", last, 0.7))
+        if last in self.strong_suffixes:
+            yield ("strong_suffix", last, 0.7)
 
         # Rule 7: Keyword/Contains (Score 0.6)
-        self._apply_keyword_rules(norm_tokens, candidates)
+        yield from self._apply_keyword_rules(frozenset(norm_tokens))
 
         # Rule 8: Type Families (Score 0.5)
-        self._apply_family_rules(norm_tokens, candidates)
-
-        return candidates
+        yield from self._apply_family_rules(first)
 
     def _apply_keyword_rules(
-        self, norm_tokens: list[str], candidates: list[tuple[str, str, float]]
-    ) -> None:
-        """Apply keyword-based clustering rules."""
-        for bucket, keywords in self.keyword_clusters.items():
-            for kw in keywords:
-                kw_norm = self.sanitizer.normalize(kw)
-                if kw_norm in norm_tokens:
-                    candidates.append(("keyword", bucket, 0.6))
-                    break
-
-    def _apply_family_rules(
-        self, norm_tokens: list[str], candidates: list[tuple[str, str, float]]
-    ) -> None:
-        """Apply type family rules based on shared prefixes."""
+        self, token_set: frozenset[str]
+    ) -> Iterator[tuple[str, str, float]]:
+        """Apply keyword-based clustering rules, one match per bucket."""
+        index = self._keyword_index
+        if not index:
+            return
+        hits = {hit for token in token_set for hit in index.get(token, ())}
+        # Report buckets in config order, as the bucket-by-bucket scan did.
+        for _position, bucket in sorted(hits):
+            yield ("keyword", bucket, 0.6)
+
+    def _apply_family_rules(self, first: str) -> Iterator[tuple[str, str, float]]:
+        """Apply type family rules based on the first normalized token."""
         min_family_len = 4
-        min_family_count = self.config["thresholds"].get("min_family_size", 3)
-        if norm_tokens:
-            first = norm_tokens[0]
-            if len(first) >= min_family_len:
-                count = self.analyzer.prefix_counts.get(first, 0)
-                if count >= min_family_count:
-                    candidates.append(("type_family", first, 0.5))
+        if (
+            len(first) >= min_family_len
+            and self.analyzer.prefix_counts.get(first, 0) >= self.min_family_size
+        ):
+            yield ("type_family", first, 0.5)
 
     def _check_metadata_hub(self, item: ItemInfo) -> tuple[str, str, float] | None:
         """Check if item belongs to a metadata hub (base class or interface)."""
@@ -275,7 +285,7 @@ class GlobalPathResolver:
             return self.hub_types[uid]
 
         name = uid.split(".")[-1]
-        return self.sanitizer.normalize(name)
+        return self._normalize(name)
 
     def _finalize_resolution(
         self,
@@ -293,16 +303,17 @@ class GlobalPathResolver:
 
         # Register
         self.assigned_paths[uid] = final_path
-        self.global_map.update(uid, final_path)
+        self._pending_updates.append((uid, final_path))
         lower_path = self._to_canonical_path(final_path)
-        self.path_registry[lower_path] = uid
+        self.registry[lower_path] = uid
 
-        # Register folders
-        p = Path(final_path)
-        for parent in p.parents:
-            if parent == Path():
-                continue
-            self.folders.add(self._to_canonical_path(str(parent)))
+        # Register folders, innermost first. A registered folder implies its
+        # ancestors are registered too, so stop at the first one already known.
+        registry = self.registry
+        for folder_key in _split_parents(lower_path):
+            if folder_key in registry and registry[folder_key] is None:
+                break
+            registry.setdefault(folder_key, None)
 
         return ResolutionResult(
             uid, final_path, rule, score, cluster_key, runner_ups, initial_root
@@ -310,38 +321,58 @@ class GlobalPathResolver:
 
     def _resolve_collisions(self, uid: str, desired_path: str) -> str:
         """Resolve path collisions between files and folders."""
-        base_no_ext = str(Path(desired_path).with_suffix(""))
-        lower_base = self._to_canonical_path(base_no_ext)
+        registry = self.registry
+        # Canonical forms are derived from one lowered path instead of
+        # canonicalizing each variant separately.
+        lower_path = self._to_canonical_path(desired_path)
+        lower_base = _strip_suffix(lower_path)
 
-        if lower_base in self.folders:
-            desired_path = f"{base_no_ext}_Page.md"
-            base_no_ext = str(Path(desired_path).with_suffix(""))
-            self._to_canonical_path(base_no_ext)
+        if lower_base in registry and registry[lower_base] is None:
+            desired_path = f"{_strip_suffix(desired_path)}_Page.md"
+            lower_path = f"{lower_base}_page.md"
 
-        p = Path(desired_path)
-        for parent in p.parents:
-            if parent == Path():
-                continue
-            parent_str = str(parent)
+        for parent_str in _split_parents(desired_path):
             file_key = self._to_canonical_path(f"{parent_str}.md")
-            if file_key in self.path_registry:
-                existing_uid = self.path_registry[file_key]
+            existing_uid = registry.get(file_key)
+            if existing_uid is not None:
                 new_existing_path = f"{parent_str}_Page.md"
-                del self.path_registry[file_key]
+                del registry[file_key]
                 self.assigned_paths[existing_uid] = new_existing_path
-                self.path_registry[self._to_canonical_path(new_existing_path)] = (
-                    existing_uid
-                )
-
-        lower_path = self._to_canonical_path(desired_path)
-        while lower_path in self.path_registry:
-            h = hashlib.sha256(uid.encode("utf-8")).hexdigest()[:4]
-            pp = Path(desired_path)
-            desired_path = f"{pp.parent}/{pp.stem}_{h}{pp.suffix}"
-            lower_path = self._to_canonical_path(desired_path)
+                registry[self._to_canonical_path(new_existing_path)] = existing_uid
+
+        if registry.get(lower_path) is None:
+            return desired_path
+
+        # The suffix only disambiguates, so a short checksum is enough; repeated
+        # collisions add a counter rather than hashing again.
+        h = format(zlib.crc32(uid.encode("utf-8")) & 0xFFFF, "04x")
+        base = _strip_suffix(desired_path)
+        ext = desired_path[len(base) :]
+        desired_path = f"{base}_{h}{ext}"
+        n = 1
+        while registry.get(self._to_canonical_path(desired_path)) is not None:
+            n += 1
+            desired_path = f"{base}_{h}_{n}{ext}"
 
         return desired_path
 
-    def _to_canonical_path(self, path: str) -> str:
+    @staticmethod
+    def _to_canonical_path(path: str) -> str:
         """Normalize a path for comparison."""
         return path.lower().replace("\\", "/")
+
+
+def _split_parents(path: str) -> tuple[str, ...]:
+    """Return the non-empty parent folders of a path, innermost first."""
+    parents = []
+    path, _sep, _name = path.rpartition("/")
+    while path:
+        parents.append(path)
+        path, _sep, _name = path.rpartition("/")
+    return tuple(parents)
+
+
+def _strip_suffix(path: str) -> str:
+    """Remove the file extension from the last path segment, if it has one."""
+    dot = path.rfind(".")
+    return path[:dot] if dot > path.rfind("/") + 1 else path
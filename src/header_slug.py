@@ -2,10 +2,10 @@
 
 import re
 
+# Runs of non-alphanumerics collapse to one hyphen, so no "--" can remain.
+NON_ALNUM_RE = re.compile(r"[^a-z0-9]+")
+
 
 def header_slug(s: str) -> str:
     """Generate a GitHub-ish anchor slug: lower, hyphenate non-alnum."""
-    s = s.strip().lower()
-    s = re.sub(r"[^a-z0-9]+", "-", s)
-    s = re.sub(r"-{2,}", "-", s).strip("-")
-    return s or "section"
+    return NON_ALNUM_RE.sub("-", s.lower()).strip("-") or "section"
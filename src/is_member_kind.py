@@ -1,7 +1,13 @@
 """Predicate for checking if an item is a member."""
 
+import functools
 
+MEMBER_KINDS = frozenset(
+    {"method", "property", "field", "event", "operator", "constructor"},
+)
+
+
+@functools.cache
 def is_member_kind(kind: str) -> bool:
     """Check if the kind represents a member (method, property, etc.)."""
-    k = kind.lower()
-    return k in {"method", "property", "field", "event", "operator", "constructor"}
+    return kind.lower() in MEMBER_KINDS
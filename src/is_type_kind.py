@@ -1,7 +1,11 @@
 """Predicate for checking if an item is a type (class, struct, etc.)."""
 
+import functools
 
+TYPE_KINDS = frozenset({"class", "struct", "interface", "enum", "delegate"})
+
+
+@functools.cache
 def is_type_kind(kind: str) -> bool:
     """Check if the kind represents a type (class, struct, etc.)."""
-    k = kind.lower()
-    return k in {"class", "struct", "interface", "enum", "delegate"}
+    return kind.lower() in TYPE_KINDS
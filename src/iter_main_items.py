@@ -1,12 +1,14 @@
 """Utility for iterating over primary items in YAML files."""
 
-from collections.abc import Iterable
 from typing import Any
 
 
-def iter_main_items(doc: dict[str, Any]) -> Iterable[dict[str, Any]]:
-    """Iterate over the main items in a DocFX YAML document."""
-    items = doc.get("items") or []
-    for it in items:
-        if isinstance(it, dict) and it.get("uid"):
-            yield it
+def iter_main_items(doc: dict[str, Any]) -> list[dict[str, Any]]:
+    """Return the main items in a DocFX YAML document.
+
+    The filter runs as one comprehension rather than a generator, since every
+    caller walks the whole list anyway.
+    """
+    return [
+        it for it in doc.get("items") or () if isinstance(it, dict) and it.get("uid")
+    ]
@@ -0,0 +1,19 @@
+"""Utility for joining rendered Markdown lines into a page."""
+
+
+def join_markdown(parts: list[str]) -> str:
+    """Join lines into a page with trailing whitespace trimmed and one newline.
+
+    Equivalent to joining with newlines, right-stripping and appending a
+    newline, but trailing blank lines are dropped before the join so the page
+    text is built once instead of being copied by rstrip and concatenation.
+    """
+    end = len(parts)
+    while end and not parts[end - 1].strip():
+        end -= 1
+    if not end:
+        return "\n"
+    lines = parts[:end]
+    lines[-1] = lines[-1].rstrip()
+    lines.append("")
+    return "\n".join(lines)
@@ -25,6 +25,7 @@ DEFAULT_CONFIG: dict[str, Any] = {
         "reroute_bias": "stability",
         "pinned_allow_singleton": False,
         "pinned_roots": [],
+        "first_match_wins": False,
         "stop_tokens": [
             "Manager",
             "Controller",
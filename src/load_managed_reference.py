@@ -1,6 +1,10 @@
 """Logic for loading managed reference YAML files."""
 
+import hashlib
+import json
+import os
 import re
+import tempfile
 from pathlib import Path
 from typing import Any
 
@@ -8,12 +12,88 @@ import yaml
 
 from src.strip_yaml_mime_header import strip_yaml_mime_header
 
+# Matches: "  name.vb: =" (an unquoted equals sign in VB names)
+VB_EQUALS_RE = re.compile(r"^(\s*[\w\.]+\.vb:\s+)(=$)", flags=re.MULTILINE)
 
-def load_managed_reference(path: Path) -> dict[str, Any]:
-    """Load and parse a DocFX ManagedReference YAML file."""
-    raw = strip_yaml_mime_header(path.read_text(encoding="utf-8"))
+# Bump when the parse pipeline changes so cached documents are not reused.
+PARSE_CACHE_VERSION = 2
+
+# Identifies the parser behind a cached document; mixed into every cache key so
+# a PyYAML upgrade or a switch between libyaml and pure Python re-parses.
+PARSE_CACHE_KEY = (
+    f"v{PARSE_CACHE_VERSION}:pyyaml-{yaml.__version__}:"
+    f"{'libyaml' if yaml.__with_libyaml__ else 'python'}"
+)
+
+# Names of the files this module writes to a cache directory: entries and the
+# temp files they are renamed from. Anything else there is left alone.
+PARSE_CACHE_ENTRY_RE = re.compile(r"^[0-9a-f]{64}(\.json|\.[\w-]+\.tmp)$")
+
+
+def load_managed_reference(
+    path: Path,
+    cache_dir: Path | None = None,
+    *,
+    refresh_cache: bool = False,
+) -> dict[str, Any]:
+    """Load and parse a DocFX ManagedReference YAML file.
+
+    With cache_dir, the parsed document is stored as JSON keyed by a hash of
+    the file's bytes and the parser identity, and later runs load that instead
+    of re-parsing the YAML. Documents JSON cannot serialize are not cached.
+    Hits refresh the entry's mtime so that build_index can prune entries a run
+    did not use. refresh_cache ignores existing entries and rewrites them.
+    """
+    data = path.read_bytes()
+    cache_file = None
+    if cache_dir is not None:
+        digest = hashlib.sha256(PARSE_CACHE_KEY.encode("ascii") + b"\0" + data)
+        cache_file = cache_dir / f"{digest.hexdigest()}.json"
+        if not refresh_cache:
+            try:
+                doc = json.loads(cache_file.read_bytes())
+                os.utime(cache_file)
+            except (OSError, ValueError):
+                pass
+            else:
+                return doc
+
+    text = data.decode("utf-8")
+    if "\r" in text:
+        # Same newline handling as reading in text mode.
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    raw = strip_yaml_mime_header(text)
     # Fix unquoted equals sign in VB names which confuses PyYAML
-    # Matches: "  name.vb: =" -> "  name.vb: '='"
-    raw = re.sub(r"^(\s*[\w\.]+\.vb:\s+)(=$)", r"\1'='", raw, flags=re.MULTILINE)
-    doc = yaml.safe_load(raw)
-    return doc or {}
+    # "  name.vb: =" -> "  name.vb: '='". Nearly every file has *.vb keys, but
+    # a line ending in "=" is rare, so check for one before running the regex.
+    if "=\n" in raw or raw.endswith("="):
+        raw = VB_EQUALS_RE.sub(r"\1'='", raw)
+    # Prefer the libyaml-backed loader; same safe semantics, several times faster.
+    if yaml.__with_libyaml__:
+        doc = yaml.load(raw, Loader=yaml.CSafeLoader)
+    else:
+        doc = yaml.safe_load(raw)
+    doc = doc or {}
+
+    if cache_file is not None:
+        _write_cache(cache_file, digest.hexdigest(), doc)
+    return doc
+
+
+def _write_cache(cache_file: Path, digest: str, doc: dict[str, Any]) -> None:
+    """Store a parsed document unless JSON cannot serialize it.
+
+    Documents holding dates and the like are always parsed from YAML instead.
+    """
+    try:
+        payload = json.dumps(doc)
+    except (TypeError, ValueError):
+        return
+    cache_file.parent.mkdir(parents=True, exist_ok=True)
+    # Write to a uniquely named file, then rename, so concurrent workers (threads
+    # included) never share a temp file or see a partial entry.
+    with tempfile.NamedTemporaryFile(
+        dir=cache_file.parent, prefix=f"{digest}.", suffix=".tmp", delete=False
+    ) as tmp:
+        tmp.write(payload.encode("utf-8"))
+    Path(tmp.name).replace(cache_file)
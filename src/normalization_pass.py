@@ -1,5 +1,6 @@
 """Logic for the concept-first normalization pass of global namespace clustering."""
 
+from collections import Counter
 from typing import TYPE_CHECKING, Any
 
 from src.canonicalize_root_name import canonicalize_root_name
@@ -463,9 +464,7 @@ class NormalizationPass:
         max_folder_size = self.config.get("max_folder_size", 250)
 
         # 1. Count items per root
-        root_counts: dict[str, int] = {}
-        for root in assignments.values():
-            root_counts[root] = root_counts.get(root, 0) + 1
+        root_counts = Counter(assignments.values())
 
         # 2. Identify oversized roots
         oversized = {
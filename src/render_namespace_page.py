@@ -1,11 +1,21 @@
 """Logic for rendering namespace overview pages."""
 
 from src.item_info import ItemInfo
+from src.join_markdown import join_markdown
 from src.link_target import LinkTarget
 from src.page_path_for_fullname import page_path_for_fullname
 from src.rewrite_xrefs import rewrite_xrefs
 from src.should_use_global_dir import should_use_global_dir
 
+# Section order on the page, with each kind's heading.
+KIND_PLURALS = {
+    "Class": "Classes",
+    "Struct": "Structs",
+    "Interface": "Interfaces",
+    "Enum": "Enums",
+    "Delegate": "Delegates",
+}
+
 
 def render_namespace_page(
     ns_fullname: str,
@@ -23,19 +33,14 @@ def render_namespace_page(
             parts.append(f"- [{child}]({page_path_for_fullname(api_root, child)})")
         parts.append("")
 
-    # Group types by kind
-    kinds = ["Class", "Struct", "Interface", "Enum", "Delegate"]
-    for k in kinds:
-        matches = [t for t in types_in_ns if t.kind.lower() == k.lower()]
+    # Group types by kind in one pass
+    by_kind: dict[str, list[ItemInfo]] = {}
+    for t in types_in_ns:
+        by_kind.setdefault(t.kind.lower(), []).append(t)
+
+    for k, plural in KIND_PLURALS.items():
+        matches = by_kind.get(k.lower())
         if matches:
-            plural = k + (
-                "es"
-                if any(
-                    k.lower().endswith(suffix)
-                    for suffix in ("s", "ss", "x", "z", "ch", "sh")
-                )
-                else "s"
-            )
             parts += [f"## {plural}", ""]
             for t in sorted(matches, key=lambda x: x.name.lower()):
                 # Resolved path
@@ -59,4 +64,4 @@ def render_namespace_page(
                     parts.append("")
             parts.append("")
 
-    return "\n".join(parts).rstrip() + "\n"
+    return join_markdown(parts)
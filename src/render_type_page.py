@@ -3,24 +3,44 @@
 from typing import Any
 
 from src.as_text import as_text
-from src.is_member_kind import is_member_kind
 from src.item_info import ItemInfo
+from src.join_markdown import join_markdown
 from src.link_target import LinkTarget
 from src.md_codeblock import md_codeblock
 from src.md_table import md_table
 from src.namespace_of import namespace_of
 from src.rewrite_xrefs import rewrite_xrefs
 
+MEMBER_KIND_ORDER = {
+    "constructor": "0",
+    "field": "1",
+    "property": "2",
+    "method": "3",
+    "event": "4",
+    "operator": "5",
+}
+MEMBER_GROUP_PLURALS = {
+    "Constructor": "Constructors",
+    "Field": "Fields",
+    "Property": "Properties",
+    "Method": "Methods",
+    "Event": "Events",
+    "Operator": "Operators",
+}
+
 
 def render_type_page(
     item: ItemInfo,
-    uid_to_item: dict[str, ItemInfo],
+    members_by_parent: dict[str, list[ItemInfo]],
     uid_targets: dict[str, LinkTarget],
     *,
     include_member_details: bool = True,
     canonical_path: str | None = None,
 ) -> str:
-    """Render a type page (class, struct, etc.) in Markdown."""
+    """Render a type page (class, struct, etc.) in Markdown.
+
+    members_by_parent comes from build_members_by_parent, built once for all pages.
+    """
     parts = []
     if canonical_path or item.uid:
         parts.append("---")
@@ -61,11 +81,12 @@ def render_type_page(
         parts += ["## Examples", example, ""]
 
     if include_member_details:
-        parts.extend(_render_type_members(item, uid_to_item, uid_targets))
+        members = members_by_parent.get(item.uid, [])
+        parts.extend(_render_type_members(members, uid_targets))
 
     parts.extend(_render_type_seealso(item, uid_targets))
 
-    return "\n".join(parts).rstrip() + "\n"
+    return join_markdown(parts)
 
 
 def _render_type_metadata(
@@ -76,16 +97,7 @@ def _render_type_metadata(
     parts = []
     ns = namespace_of(item)
     if ns:
-        ns_parts = ns.split(".")
-        ns_links = []
-        curr = ""
-        for p in ns_parts:
-            if curr:
-                curr += "."
-            curr += p
-            t = uid_targets.get(curr)
-            ns_links.append(f"[{p}]({t.page_path})" if t else p)
-        parts.append(f"**Namespace:** {' . '.join(ns_links)}")
+        parts.append(f"**Namespace:** {_namespace_crumbs(ns, uid_targets)}")
 
     assemblies = item.raw.get("assemblies")
     if assemblies:
@@ -98,6 +110,19 @@ def _render_type_metadata(
     return parts
 
 
+def _namespace_crumbs(ns: str, uid_targets: dict[str, LinkTarget]) -> str:
+    """Render the linked namespace breadcrumb."""
+    ns_links = []
+    curr = ""
+    for p in ns.split("."):
+        if curr:
+            curr += "."
+        curr += p
+        t = uid_targets.get(curr)
+        ns_links.append(f"[{p}]({t.page_path})" if t else p)
+    return " . ".join(ns_links)
+
+
 def _render_type_attributes(
     item: ItemInfo,
     uid_targets: dict[str, LinkTarget],
@@ -317,47 +342,26 @@ def _render_member(
     return parts
 
 
+def _member_key(m: ItemInfo) -> tuple[str, str]:
+    """Sort members by kind group, then case-insensitively by name."""
+    return (MEMBER_KIND_ORDER.get(m.kind.lower(), "9"), m.name.lower())
+
+
 def _render_type_members(
-    item: ItemInfo,
-    uid_to_item: dict[str, ItemInfo],
+    members: list[ItemInfo],
     uid_targets: dict[str, LinkTarget],
 ) -> list[str]:
     """Render type members grouped by kind."""
-    members = [
-        m
-        for m in uid_to_item.values()
-        if m.parent == item.uid and is_member_kind(m.kind)
-    ]
     if not members:
         return []
 
-    def member_key(m: ItemInfo) -> tuple[str, str]:
-        order = {
-            "constructor": "0",
-            "field": "1",
-            "property": "2",
-            "method": "3",
-            "event": "4",
-            "operator": "5",
-        }
-        k = m.kind.lower()
-        return (order.get(k, "9"), m.name.lower())
-
     parts = []
-    members_sorted = sorted(members, key=member_key)
+    members_sorted = sorted(members, key=_member_key)
     current_group: str | None = None
-    group_plural_map = {
-        "Constructor": "Constructors",
-        "Field": "Fields",
-        "Property": "Properties",
-        "Method": "Methods",
-        "Event": "Events",
-        "Operator": "Operators",
-    }
 
     for m in members_sorted:
         group = m.kind.capitalize()
-        group = group_plural_map.get(group, group)
+        group = MEMBER_GROUP_PLURALS.get(group, group)
         if group != current_group:
             parts += [f"## {group}", ""]
             current_group = group
@@ -3,7 +3,7 @@
 from dataclasses import dataclass, field
 
 
-@dataclass
+@dataclass(slots=True)
 class ResolutionResult:
     """Represents the outcome of resolving a global UID to a file path."""
 
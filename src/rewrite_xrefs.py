@@ -8,29 +8,32 @@ XREF_TAG_RE = re.compile(r"<xref:([^?>#]+)(?:\?[^>#]*)?(?:#[^>]*)?>")
 XREF_MD_LINK_RE = re.compile(
     r"\((xref:([^)?#]+)(?:\?[^)#]*)?(?:#[^)]+)?)\)",
 )  # (xref:UID?...)
+# Both forms in one alternation so each text is scanned once. Group 1 holds the
+# UID of a <xref:UID> tag, group 3 the UID of an (xref:UID) link target.
+XREF_ANY_RE = re.compile(f"{XREF_TAG_RE.pattern}|{XREF_MD_LINK_RE.pattern}")
 
 
 def rewrite_xrefs(text: str, uid_targets: dict[str, LinkTarget]) -> str:
     """Rewrite DocFX XRef tags to Markdown links."""
     if not text:
         return ""
-
-    # <xref:UID> -> [Title](/api/...)
-    def repl_tag(m: re.Match) -> str:
-        uid = m.group(1)
-        t = uid_targets.get(uid)
-        if not t:
-            return f"`{uid}`"
-        return f"[{t.title}]({t.page_path})"
-
-    text = XREF_TAG_RE.sub(repl_tag, text)
-
-    # (xref:UID) -> (/api/...)
-    def repl_link(m: re.Match) -> str:
-        uid = m.group(2)
-        t = uid_targets.get(uid)
+    # Most summaries and descriptions contain no XRefs at all.
+    if "xref:" not in text:
+        return text
+
+    def repl(m: re.Match) -> str:
+        tag_uid = m.group(1)
+        if tag_uid is not None:
+            # <xref:UID> -> [Title](/api/...)
+            t = uid_targets.get(tag_uid)
+            if not t:
+                return f"`{tag_uid}`"
+            return f"[{t.title}]({t.page_path})"
+
+        # (xref:UID) -> (/api/...)
+        t = uid_targets.get(m.group(3))
         if not t:
             return "(#)"
         return f"({t.page_path})"
 
-    return XREF_MD_LINK_RE.sub(repl_link, text)
+    return XREF_ANY_RE.sub(repl, text)
@@ -10,6 +10,7 @@ from src.build_link_targets import build_link_targets
 from src.build_ns_graph import build_ns_graph
 from src.cluster_report import ClusterReport
 from src.compute_config_hash import compute_config_hash
+from src.find_yml_files import find_yml_files
 from src.global_namespace_map import CURRENT_SCHEMA_VERSION, GlobalNamespaceMap
 from src.global_path_resolver import GlobalPathResolver
 from src.is_type_kind import is_type_kind
@@ -23,6 +24,7 @@ from src.sanitizer import Sanitizer
 from src.should_use_global_dir import should_use_global_dir
 from src.stub_generator import StubGenerator
 from src.tokenizer import Tokenizer
+from src.write_markdown import write_markdown
 from src.write_type_pages import write_type_pages
 
 if TYPE_CHECKING:
@@ -32,13 +34,18 @@ if TYPE_CHECKING:
 
 def run_conversion(args: argparse.Namespace) -> int:
     """Execute the full conversion pipeline."""
-    yml_files = sorted(args.yml_dir.rglob("*.yml"))
+    yml_files = find_yml_files(args.yml_dir)
     if not yml_files:
         msg = f"No .yml files found under: {args.yml_dir}"
         raise SystemExit(msg)
 
     config, global_map = _init_infra(args)
-    uid_to_item, uid_to_ref = build_index(yml_files)
+    uid_to_item, uid_to_ref = build_index(
+        yml_files,
+        max_workers=args.jobs,
+        cache_dir=args.yaml_cache,
+        refresh_cache=args.refresh_yaml_cache,
+    )
 
     analyzer = _analyze_metadata(uid_to_item, config)
     global_resolved = _resolve_global_paths(
@@ -60,12 +67,14 @@ def run_conversion(args: argparse.Namespace) -> int:
     out_root = args.out_dir.resolve()
     out_root.mkdir(parents=True, exist_ok=True)
 
-    written = _render_all_pages(uid_to_item, uid_targets, out_root, args)
+    written, unchanged = _render_all_pages(uid_to_item, uid_targets, out_root, args)
 
     if args.home_page:
-        _write_home_page(out_root, args.api_root)
+        _write_home_page(out_root, args.api_root, skip_unchanged=args.skip_unchanged)
 
     print(f"Generated {written} Markdown pages into: {out_root}")
+    if unchanged:
+        print(f"Skipped {unchanged} unchanged Markdown pages")
     return 0
 
 
@@ -104,7 +113,8 @@ def _resolve_global_paths(
 ) -> dict[str, "ResolutionResult"]:
     """Resolve target paths for items in the global namespace."""
     resolver = GlobalPathResolver(analyzer, global_map, config)
-    report = ClusterReport(compute_config_hash(config), CURRENT_SCHEMA_VERSION)
+    # The map already holds the hash of this config; don't serialize it again.
+    report = ClusterReport(global_map.current_config_hash, CURRENT_SCHEMA_VERSION)
 
     # Collect items needing resolution
     global_items = [
@@ -138,8 +148,11 @@ def _render_all_pages(
     uid_targets: dict[str, Any],
     out_root: Path,
     args: argparse.Namespace,
-) -> int:
-    """Render all type and namespace pages to disk."""
+) -> tuple[int, int]:
+    """Render all type and namespace pages to disk.
+
+    Returns the number of pages written and the number skipped as unchanged.
+    """
     ns_to_types: dict[str, list[ItemInfo]] = {}
     for it in uid_to_item.values():
         if is_type_kind(it.kind):
@@ -147,7 +160,7 @@ def _render_all_pages(
             ns_to_types.setdefault(ns, []).append(it)
 
     ns_children = build_ns_graph(ns_to_types)
-    written = write_type_pages(uid_to_item, uid_targets, args, out_root)
+    written, unchanged = write_type_pages(uid_to_item, uid_targets, args, out_root)
 
     if args.include_namespace_pages:
         for ns, types in sorted(ns_to_types.items(), key=lambda kv: kv[0].lower()):
@@ -163,13 +176,17 @@ def _render_all_pages(
                 api_root=args.api_root,
             )
             out_file = output_file_for_page(out_root, page_path)
-            out_file.write_text(md, encoding="utf-8")
-            written += 1
+            if write_markdown(out_file, md, skip_unchanged=args.skip_unchanged):
+                written += 1
+            else:
+                unchanged += 1
 
-    return written
+    return written, unchanged
 
 
-def _write_home_page(out_root: Path, api_root: str) -> None:
+def _write_home_page(
+    out_root: Path, api_root: str, *, skip_unchanged: bool = False
+) -> None:
     """Generate a simple home page for the Wiki."""
     home = [
         "# Home",
@@ -179,4 +196,4 @@ def _write_home_page(out_root: Path, api_root: str) -> None:
         f"- Browse the API under `{api_root}`",
         "",
     ]
-    (out_root / "home.md").write_text("\n".join(home), encoding="utf-8")
+    write_markdown(out_root / "home.md", "\n".join(home), skip_unchanged=skip_unchanged)
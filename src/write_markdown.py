@@ -0,0 +1,26 @@
+"""Utility for writing generated Markdown files to disk."""
+
+import os
+from pathlib import Path
+
+
+def write_markdown(path: Path, content: str, *, skip_unchanged: bool = False) -> bool:
+    """Write a Markdown file, optionally leaving identical files untouched.
+
+    The page is encoded once (with the platform's text-mode line endings) and
+    both the comparison and the write work on those bytes, so the existing
+    file is never decoded.
+
+    Returns True if the file was written.
+    """
+    if os.linesep != "\n":
+        content = content.replace("\n", os.linesep)
+    data = content.encode("utf-8")
+    if skip_unchanged:
+        try:
+            if path.read_bytes() == data:
+                return False
+        except FileNotFoundError:
+            pass
+    path.write_bytes(data)
+    return True
@@ -1,8 +1,10 @@
 """Logic for writing type pages to disk."""
 
 import argparse
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 
+from src.build_members_by_parent import build_members_by_parent
 from src.is_type_kind import is_type_kind
 from src.item_info import ItemInfo
 from src.link_target import LinkTarget
@@ -10,6 +12,11 @@ from src.output_file_for_page import output_file_for_page
 from src.page_path_for_fullname import page_path_for_fullname
 from src.render_type_page import render_type_page
 from src.should_use_global_dir import should_use_global_dir
+from src.write_markdown import write_markdown
+
+# File writes block on the kernel and release the GIL; a few threads are enough
+# to overlap them with rendering.
+WRITE_WORKERS = 4
 
 
 def write_type_pages(
@@ -17,34 +24,55 @@ def write_type_pages(
     uid_targets: dict[str, LinkTarget],
     args: argparse.Namespace,
     out_root: Path,
-) -> int:
-    """Write all type pages to disk."""
-    written = 0
+) -> tuple[int, int]:
+    """Write all type pages to disk.
+
+    Pages are rendered on this thread and handed to a small thread pool for
+    writing, so disk latency overlaps with rendering the next page.
+
+    Returns the number of pages written and the number skipped as unchanged.
+    """
+    queued = 0
     type_items = [it for it in uid_to_item.values() if is_type_kind(it.kind)]
     total_types = len(type_items)
     print(f"Writing {total_types} type pages...")
-    for it in type_items:
-        target = uid_targets.get(it.uid)
-        if not target:
-            use_global = should_use_global_dir(it.namespace)
-            page_path = page_path_for_fullname(
-                args.api_root,
-                it.full_name,
-                use_global_dir=use_global,
+    # One pass over all items instead of a full scan per type page.
+    members_by_parent = build_members_by_parent(uid_to_item)
+    pending: dict[Path, Future[bool]] = {}
+    futures: list[Future[bool]] = []
+    with ThreadPoolExecutor(max_workers=WRITE_WORKERS) as executor:
+        for it in type_items:
+            target = uid_targets.get(it.uid)
+            if not target:
+                use_global = should_use_global_dir(it.namespace)
+                page_path = page_path_for_fullname(
+                    args.api_root,
+                    it.full_name,
+                    use_global_dir=use_global,
+                )
+            else:
+                page_path = target.page_path
+
+            md = render_type_page(
+                it,
+                members_by_parent=members_by_parent,
+                uid_targets=uid_targets,
+                include_member_details=args.include_member_details,
+                canonical_path=page_path,
+            )
+            out_file = output_file_for_page(out_root, page_path)
+            # Keep "last page wins" if two types map to the same file.
+            previous = pending.get(out_file)
+            if previous is not None:
+                previous.result()
+            pending[out_file] = future = executor.submit(
+                write_markdown, out_file, md, skip_unchanged=args.skip_unchanged
             )
-        else:
-            page_path = target.page_path
-
-        md = render_type_page(
-            it,
-            uid_to_item=uid_to_item,
-            uid_targets=uid_targets,
-            include_member_details=args.include_member_details,
-            canonical_path=page_path,
-        )
-        out_file = output_file_for_page(out_root, page_path)
-        out_file.write_text(md, encoding="utf-8")
-        written += 1
-        if written % 50 == 0:
-            print(f"  ... wrote {written}/{total_types} types")
-    return written
+            futures.append(future)
+            queued += 1
+            if queued % 50 == 0:
+                print(f"  ... queued {queued}/{total_types} types")
+
+        # Count only completed writes; this also surfaces any write error.
+        written = sum(future.result() for future in futures)
+    return written, len(futures) - written
@@ -72,6 +72,10 @@ def test_analyzer_top_k() -> None:
     top_all = analyzer.get_top_prefixes(k=5, min_size=1)
     assert top_all == ["A", "B"]
 
+    # Ties on count are broken alphabetically
+    analyzer.prefix_counts["Aa"] = 10
+    assert analyzer.get_top_prefixes(k=2, min_size=1) == ["A", "Aa"]
+
 
 def test_analyzer_suffixes() -> None:
     """Verify strong suffix identification logic."""
@@ -1,19 +1,28 @@
 """Tests for the docfx_yml_to_wikijs module."""
 
+import datetime as dt
+import os
 import sys
 from pathlib import Path
 from unittest.mock import patch
 
+import pytest
+
 from src.as_text import as_text
+from src.build_index import PARALLEL_MIN_FILES, build_index
 from src.build_link_targets import build_link_targets
+from src.build_members_by_parent import build_members_by_parent
+from src.build_ns_graph import build_ns_graph
 from src.docfx_yml_to_wikijs import main
 from src.dot_safe import dot_safe
+from src.find_yml_files import find_yml_files
 from src.header_slug import header_slug
 from src.is_member_kind import is_member_kind
 from src.is_namespace_kind import is_namespace_kind
 from src.is_type_kind import is_type_kind
 from src.item_info import ItemInfo
 from src.iter_main_items import iter_main_items
+from src.join_markdown import join_markdown
 from src.link_target import LinkTarget
 from src.load_managed_reference import load_managed_reference
 from src.md_codeblock import md_codeblock
@@ -77,6 +86,13 @@ def test_md_table() -> None:
     assert md_table(headers, rows) == expected
 
 
+def test_join_markdown() -> None:
+    """Test joining page lines with trailing blank lines trimmed."""
+    assert join_markdown([]) == "\n"
+    assert join_markdown(["", "  "]) == "\n"
+    assert join_markdown(["# Title", "", "Body  ", "", ""]) == "# Title\n\nBody\n"
+
+
 def test_kind_predicates() -> None:
     """Test item kind predicate functions."""
     assert is_type_kind("Class")
@@ -275,6 +291,37 @@ def test_build_link_targets_definition_resolution() -> None:
     assert targets["System.Collections.Generic.List{System.String}"].title == "List<T>"
 
 
+def test_build_link_targets_definition_chain() -> None:
+    """Test that definitions resolve through chains regardless of ref order."""
+    uid_to_ref = {
+        "A": {"uid": "A", "definition": "B"},
+        "B": {"uid": "B", "name": "B<T>", "definition": "C"},
+        "C": {"uid": "C", "name": "C<T>", "href": "https://msdn.com/C"},
+        "D": {"uid": "D", "definition": "Missing"},
+        "E": {"uid": "E", "definition": "F"},
+        "F": {"uid": "F", "definition": "E"},
+    }
+
+    targets = build_link_targets({}, uid_to_ref, "/api")
+
+    assert targets["A"] == LinkTarget(title="B<T>", page_path="https://msdn.com/C")
+    assert targets["B"] == LinkTarget(title="B<T>", page_path="https://msdn.com/C")
+    assert targets["D"] == LinkTarget(title="D", page_path="#")
+    assert targets["E"].page_path == "#"
+    assert targets["F"].page_path == "#"
+
+
+def test_build_ns_graph() -> None:
+    """Test namespace graph edges, including intermediate namespaces."""
+    graph = build_ns_graph({"A.B.C": [], "A.B.D": [], "A": [], "E": [], "": []})
+
+    assert graph == {
+        "A": {"A.B"},
+        "A.B": {"A.B.C", "A.B.D"},
+        "E": set(),
+    }
+
+
 def test_rewrite_xrefs() -> None:
     """Test rewriting XRef tags to Markdown links."""
     targets = {
@@ -297,6 +344,16 @@ def test_rewrite_xrefs() -> None:
     assert rewrite_xrefs(text3, targets) == "Unknown `Unknown.Uid`"
 
 
+def test_find_yml_files(tmp_path: Path) -> None:
+    """Test YAML discovery matches a sorted recursive glob."""
+    for rel in ["b.yml", "a/c.yml", "a-d/e.yml", "a/skip.yaml", "toc.yml"]:
+        f = tmp_path / rel
+        f.parent.mkdir(parents=True, exist_ok=True)
+        f.write_text("", encoding="utf-8")
+
+    assert find_yml_files(tmp_path) == sorted(tmp_path.rglob("*.yml"))
+
+
 def test_load_managed_reference(tmp_path: Path) -> None:
     """Test loading a ManagedReference YAML file."""
     f = tmp_path / "test.yml"
@@ -307,6 +364,94 @@ def test_load_managed_reference(tmp_path: Path) -> None:
     doc = load_managed_reference(f)
     assert doc["items"][0]["uid"] == "Test"
 
+    # Unquoted "=" VB operator names are quoted before parsing.
+    f.write_text(
+        "items:\n  - uid: Op\n    name.vb: =\n    nameWithType.vb: A.=",
+        encoding="utf-8",
+    )
+    item = load_managed_reference(f)["items"][0]
+    assert item["name.vb"] == "="
+    assert item["nameWithType.vb"] == "A.="
+
+
+def test_load_managed_reference_cache(tmp_path: Path) -> None:
+    """Test that parsed documents are reused from the YAML cache."""
+    f = tmp_path / "test.yml"
+    f.write_text("items:\n  - uid: Test", encoding="utf-8")
+    cache_dir = tmp_path / "cache"
+
+    assert load_managed_reference(f, cache_dir)["items"][0]["uid"] == "Test"
+    (entry,) = cache_dir.iterdir()
+
+    # A hit is served from the cache entry rather than the YAML.
+    entry.write_text('{"items": [{"uid": "Cached"}]}', encoding="utf-8")
+    assert load_managed_reference(f, cache_dir)["items"][0]["uid"] == "Cached"
+
+    # Refreshing re-parses the YAML and rewrites the entry.
+    doc = load_managed_reference(f, cache_dir, refresh_cache=True)
+    assert doc["items"][0]["uid"] == "Test"
+    assert load_managed_reference(f, cache_dir)["items"][0]["uid"] == "Test"
+
+
+def test_load_managed_reference_cache_skips_lossy_documents(tmp_path: Path) -> None:
+    """Test that documents JSON would alter are not cached."""
+    f = tmp_path / "test.yml"
+    f.write_text("items:\n  - uid: Test\n    since: 2024-01-31", encoding="utf-8")
+    cache_dir = tmp_path / "cache"
+    since = dt.date(2024, 1, 31)
+
+    assert load_managed_reference(f, cache_dir)["items"][0]["since"] == since
+    assert not cache_dir.exists()
+    assert load_managed_reference(f, cache_dir)["items"][0]["since"] == since
+
+
+def test_build_index_prunes_unused_cache_entries(tmp_path: Path) -> None:
+    """Test that cache entries a run did not use are removed."""
+    f = tmp_path / "test.yml"
+    f.write_text("items:\n  - uid: Test", encoding="utf-8")
+    cache_dir = tmp_path / "cache"
+    build_index([f], max_workers=1, cache_dir=cache_dir)
+    (used,) = cache_dir.glob("*.json")
+
+    stale = cache_dir / f"{'0' * 64}.json"
+    stale_tmp = cache_dir / f"{'0' * 64}.abc_123.tmp"
+    foreign = cache_dir / "docfx.json"
+    for path in (stale, stale_tmp, foreign):
+        path.write_text("{}", encoding="utf-8")
+        os.utime(path, (0, 0))
+    os.utime(used, (0, 0))
+    build_index([f], max_workers=1, cache_dir=cache_dir)
+
+    assert not stale.exists()
+    assert not stale_tmp.exists()
+    assert used.exists()
+    assert foreign.exists()
+
+
+def test_build_index_parallel_matches_serial(tmp_path: Path) -> None:
+    """Test that parsing in worker processes yields the same index as serially."""
+    files = []
+    for i in range(PARALLEL_MIN_FILES):
+        f = tmp_path / f"T{i}.yml"
+        f.write_text(
+            "### YamlMime:ManagedReference\n"
+            f"items:\n  - uid: T{i}\n    type: Class\n    summary: S{i}\n"
+            f"references:\n  - uid: R{i}\n    name: R{i}\n",
+            encoding="utf-8",
+        )
+        files.append(f)
+
+    serial_items, serial_refs = build_index(files, max_workers=1)
+    parallel_items, parallel_refs = build_index(files, max_workers=2)
+    threaded_items, threaded_refs = build_index(files[:3], max_workers=2)
+
+    assert list(parallel_items) == list(serial_items)
+    assert parallel_items == serial_items
+    assert parallel_refs == serial_refs
+    assert parallel_items["T3"].summary == "S3"
+    assert list(threaded_items) == ["T0", "T1", "T2"]
+    assert list(threaded_refs) == ["R0", "R1", "R2"]
+
 
 def test_iter_main_items() -> None:
     """Test iterating over main items in a document."""
@@ -430,7 +575,7 @@ def test_render_type_page() -> None:
     # Render
     md = render_type_page(
         class_item,
-        uid_to_item=uid_to_item,
+        members_by_parent=build_members_by_parent(uid_to_item),
         uid_targets=uid_targets,
         include_member_details=True,
     )
@@ -600,3 +745,38 @@ def test_render_type_relationships() -> None:
     assert "## Extension Methods" in md
     assert "- [ExtMethod](/api/ExtMethod)" in md
     assert "- `UnknownExt`" in md
+
+
+def test_main_skip_unchanged_preserves_mtime(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    """Test that --skip-unchanged leaves identical output files untouched."""
+    src = tmp_path / "src"
+    src.mkdir()
+    (src / "test.yml").write_text(
+        "### YamlMime:ManagedReference\n"
+        "items:\n"
+        "  - uid: My.Class\n"
+        "    type: Class\n"
+        "    name: Class\n"
+        "    fullName: My.Class\n"
+        "    namespace: My\n",
+        encoding="utf-8",
+    )
+    out = tmp_path / "out"
+    test_args = ["script_name", str(src), str(out), "--skip-unchanged"]
+
+    with patch.object(sys, "argv", test_args):
+        assert main() == 0
+
+    page = out / "api/My/Class.md"
+    os.utime(page, ns=(0, 0))
+    capsys.readouterr()
+
+    with patch.object(sys, "argv", test_args):
+        assert main() == 0
+
+    assert page.stat().st_mtime_ns == 0
+    output = capsys.readouterr().out
+    assert "Generated 0 Markdown pages" in output
+    assert "Skipped 1 unchanged Markdown pages" in output
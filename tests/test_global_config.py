@@ -1,5 +1,6 @@
 """Tests for configuration loading and merging."""
 
+import hashlib
 from pathlib import Path
 
 import yaml
@@ -41,6 +42,16 @@ def test_deep_merge_acronyms_additive() -> None:
     assert merged["acronyms"] == ["A", "B", "C"]
 
 
+def test_deep_merge_does_not_mutate_base() -> None:
+    """Verify that merging leaves the base dictionary untouched."""
+    base = {"nested": {"x": 1}, "acronyms": ["A"], "flag": False}
+    merged = deep_merge(base, {"flag": True})
+    assert merged == {"nested": {"x": 1}, "acronyms": ["A"], "flag": True}
+
+    deep_merge(base, {"nested": {"x": 2}, "acronyms": ["B"]})
+    assert base == {"nested": {"x": 1}, "acronyms": ["A"], "flag": False}
+
+
 def test_compute_config_hash_stability() -> None:
     """Verify that config hash is stable regardless of key order."""
     config1 = {"b": 2, "a": 1, "nested": {"y": 2, "x": 1}}
@@ -48,6 +59,12 @@ def test_compute_config_hash_stability() -> None:
     assert compute_config_hash(config1) == compute_config_hash(config2)
 
 
+def test_compute_config_hash_format_is_unchanged() -> None:
+    """Verify that hashes stay comparable with existing maps and reports."""
+    expected = hashlib.sha256(b'{"a": 1, "b": [2, 3]}').hexdigest()
+    assert compute_config_hash({"b": [2, 3], "a": 1}) == expected
+
+
 def test_load_config_defaults() -> None:
     """Verify that default config is loaded when no path is provided."""
     config = load_config(None)
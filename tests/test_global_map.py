@@ -71,3 +71,107 @@ def test_ignore_schema_mismatch(tmp_path: Path) -> None:
     cache = GlobalNamespaceMap(str(cache_file), "hash1")
     cache.load(accept_legacy=False)
     assert cache.lookup("uid1") is None
+
+
+def test_save_output_is_key_sorted(tmp_path: Path) -> None:
+    """Verify that saved output is key-sorted regardless of insertion order."""
+    cache_file = tmp_path / "map.json"
+    cache = GlobalNamespaceMap(str(cache_file), "hash1")
+    cache.update("uid_b", "path/b")
+    cache.update("uid_a", "path/a")
+    cache.save()
+
+    cache2 = GlobalNamespaceMap(str(cache_file), "hash1")
+    cache2.load()
+    cache2.meta["extra"] = {"z": 1, "a": 2}
+    cache2.update("uid_0", "path/0")
+    cache2.update("uid_c", "path/c")
+    cache2.save()
+
+    text = cache_file.read_text(encoding="utf-8")
+    assert text == json.dumps(json.loads(text), indent=2, sort_keys=True)
+    assert list(json.loads(text)["mapping"]) == ["uid_0", "uid_a", "uid_b", "uid_c"]
+
+
+def test_save_skips_unchanged_map(tmp_path: Path) -> None:
+    """Verify that a run which neither changed nor used the map skips the write."""
+    cache_file = tmp_path / "map.json"
+    cache = GlobalNamespaceMap(str(cache_file), "hash1")
+    cache.update("uid1", "path/1")
+    cache.save()
+    before = cache_file.read_bytes()
+
+    cache2 = GlobalNamespaceMap(str(cache_file), "hash1")
+    cache2.load()
+    cache2.save()
+    assert cache_file.read_bytes() == before
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+def test_bulk_update_matches_update(tmp_path: Path) -> None:
+    """Verify that bulk_update behaves like repeated update calls."""
+    pairs = [("uid_b", "path/b"), ("uid_a", "path/a"), ("uid_b", "path/b2")]
+    single = GlobalNamespaceMap(str(tmp_path / "single.json"), "hash1")
+    for uid, path in pairs:
+        single.update(uid, path)
+    bulk = GlobalNamespaceMap(str(tmp_path / "bulk.json"), "hash1")
+    bulk.bulk_update(pairs)
+
+    assert bulk.paths == single.paths
+    assert bulk.accessed_uids == single.accessed_uids
+    assert bulk.dirty
+    single.save()
+    bulk.save()
+    assert (tmp_path / "bulk.json").read_bytes() == (
+        tmp_path / "single.json"
+    ).read_bytes()
+
+
+def test_load_skips_invalid_entries(tmp_path: Path) -> None:
+    """Verify that bad entries are skipped individually and force a rewrite."""
+    cache_file = tmp_path / "map.json"
+    cache = GlobalNamespaceMap(str(cache_file), "hash1")
+    cache.update("good", "path/good")
+    cache.update("after", "path/after")
+    cache.save()
+
+    data = json.loads(cache_file.read_text(encoding="utf-8"))
+    data["mapping"]["bad_list"] = ["not", "a", "dict"]
+    data["mapping"]["empty_path"] = {"path": "", "last_seen": 1}
+    data["mapping"]["missing_path"] = {"last_seen": 1}
+    cache_file.write_text(json.dumps(data), encoding="utf-8")
+
+    cache2 = GlobalNamespaceMap(str(cache_file), "hash1")
+    cache2.load()
+    assert cache2.lookup("good") == "path/good"
+    assert cache2.lookup("after") == "path/after"
+    assert cache2.lookup("bad_list") is None
+    assert cache2.dirty
+
+    cache2.save()
+    saved = json.loads(cache_file.read_text(encoding="utf-8"))
+    assert set(saved["mapping"]) == {"good", "after"}
+
+
+def test_load_coerces_bad_last_seen(tmp_path: Path) -> None:
+    """Verify that non-integer last_seen values are saved back as valid JSON."""
+    cache_file = tmp_path / "map.json"
+    cache = GlobalNamespaceMap(str(cache_file), "hash1")
+    cache.update("a", "path/a")
+    cache.update("b", "path/b")
+    cache.save()
+
+    data = json.loads(cache_file.read_text(encoding="utf-8"))
+    data["mapping"]["a"]["last_seen"] = None
+    data["mapping"]["b"]["last_seen"] = True
+    data["meta"]["run_id"] = None
+    cache_file.write_text(json.dumps(data), encoding="utf-8")
+
+    cache2 = GlobalNamespaceMap(str(cache_file), "hash1")
+    cache2.load()
+    cache2.save(prune_stale_threshold=5)
+
+    saved = json.loads(cache_file.read_text(encoding="utf-8"))
+    assert saved["mapping"]["a"] == {"last_seen": 0, "path": "path/a"}
+    assert saved["mapping"]["b"] == {"last_seen": 0, "path": "path/b"}
+    assert saved["meta"]["run_id"] == 1
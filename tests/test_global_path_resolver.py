@@ -116,6 +116,23 @@ def test_collision_file_vs_file(
     assert "_Page" not in res2.final_path  # _Page is for folder collisions
 
 
+def test_collision_repeated_suffix(
+    resolver_deps: tuple[MagicMock, MagicMock, dict[str, Any]],
+) -> None:
+    """Verify that a hash suffix collision falls back to a counter."""
+    analyzer, global_map, config = resolver_deps
+    resolver = GlobalPathResolver(analyzer, global_map, config)
+
+    res1 = resolver.resolve(create_item("uid1", "SameName"))
+    res2 = resolver.resolve(create_item("uid2", "SameName"))
+    # Reusing the UID reproduces the same hash suffix.
+    res3 = resolver.resolve(create_item("uid2", "SameName"))
+
+    paths = [res1.final_path, res2.final_path, res3.final_path]
+    assert len(set(paths)) == len(paths)
+    assert res3.final_path == res2.final_path.replace(".md", "_2.md")
+
+
 def test_collision_folder_vs_file(
     resolver_deps: tuple[MagicMock, MagicMock, dict[str, Any]],
 ) -> None:
@@ -150,6 +167,25 @@ def test_keyword_cluster(
     assert res.winning_rule == "keyword"
 
 
+def test_first_match_wins(
+    resolver_deps: tuple[MagicMock, MagicMock, dict[str, Any]],
+) -> None:
+    """Verify that first_match_wins keeps only the winning rule."""
+    analyzer, global_map, config = resolver_deps
+    item = create_item("uid1", "StoryWindowUI")
+
+    resolver = GlobalPathResolver(analyzer, global_map, config)
+    all_rules = resolver._apply_rules(item)  # noqa: SLF001
+    assert [rule for rule, _key, _score in all_rules] == [
+        "priority_suffix",
+        "strong_prefix",
+    ]
+
+    config["rules"]["first_match_wins"] = True
+    resolver = GlobalPathResolver(analyzer, global_map, config)
+    assert resolver._apply_rules(item) == all_rules[:1]  # noqa: SLF001
+
+
 def test_metadata_hub_base_class(
     resolver_deps: tuple[MagicMock, MagicMock, dict[str, Any]],
 ) -> None: